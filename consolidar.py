@@ -2,8 +2,16 @@ import os
 import sys
 import math
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# orjson serializa en C y es opcional; sin él se usa el json de stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- CONFIGURACIÓN ---
 NOMBRE_CARPETA_BIBLIOTECA = "_BIBLIOTECA"
 CARPETA_EXPORTACION = "_EXPORTS_NOTEBOOK"
@@ -15,19 +23,153 @@ TRANSCRIPCIONES_POR_TXT = 100
 # Separador semántico optimizado para NotebookLM/RAG
 SEPARADOR_TRANSCRIPCION = "\n\n---\n[FIN DE TRANSCRIPCION]\n---\n\n"
 
+# Buffers precodificados: la salida de volúmenes es binaria y estos
+# fragmentos fijos se escriben miles de veces, así que se codifican una vez
+SEPARADOR_BYTES = SEPARADOR_TRANSCRIPCION.encode('utf-8')
+LINEA_DOBLE_BYTES = ("\n\n" + "=" * 60 + "\n").encode('utf-8')
+LINEA_SIMPLE_BYTES = ("=" * 60 + "\n\n").encode('utf-8')
+TITULO_INDICE_BYTES = "=== ÍNDICE DE ESTE VOLUMEN ===\n".encode('utf-8')
+
+# Segundos mínimos entre actualizaciones del indicador de progreso (~20 Hz)
+INTERVALO_PROGRESO = 0.05
+
+
+def _escribir_buffers(fd_salida, buffers):
+    """Emite varios buffers con un solo writev; cae a write si no existe."""
+    if hasattr(os, 'writev'):
+        os.writev(fd_salida, buffers)
+    else:
+        os.write(fd_salida, b''.join(buffers))
+
+
+def _copiar_contenido(fd_salida, fd_entrada, tam):
+    """
+    Copia archivo→archivo con sendfile (copia en espacio de kernel).
+
+    Si sendfile no está disponible o falla antes de copiar nada, cae a un
+    bucle read/write clásico.
+    """
+    desplazamiento = 0
+    if hasattr(os, 'sendfile'):
+        try:
+            while desplazamiento < tam:
+                enviados = os.sendfile(fd_salida, fd_entrada, desplazamiento, tam - desplazamiento)
+                if enviados == 0:
+                    break
+                desplazamiento += enviados
+            return
+        except OSError:
+            if desplazamiento:
+                raise
+
+    os.lseek(fd_entrada, 0, os.SEEK_SET)
+    while True:
+        bloque = os.read(fd_entrada, 1 << 20)
+        if not bloque:
+            break
+        os.write(fd_salida, bloque)
+
 
 def validar_archivo_procesado(contenido):
     """
     Verifica que el archivo sea una transcripción procesada por limpiar.py.
     Los archivos válidos comienzan con '# ' (título markdown).
     """
-    return contenido.strip().startswith("# ")
+    return bytes(contenido[:16]).lstrip().startswith(b"# ")
 
 
 def extraer_titulo_de_contenido(contenido):
     """Extrae el título del archivo markdown (primera línea sin #)."""
-    primera_linea = contenido.split('\n')[0]
-    return primera_linea.lstrip('# ').strip()
+    primera_linea = bytes(contenido[:512]).split(b'\n', 1)[0]
+    return primera_linea.decode('utf-8', errors='ignore').lstrip('# ').strip()
+
+
+def _generar_volumen(ruta_biblioteca, ruta_export, nombre_proyecto,
+                     numero_volumen, inicio, lote, total_volumenes):
+    """
+    Escribe un volumen completo y devuelve (nombre_salida, incluidos, omitidos).
+
+    Pensada para ejecutarse en un hilo por volumen: no toca estado compartido.
+    """
+    nombre_salida = f"{nombre_proyecto}_Vol{numero_volumen:02d}.txt"
+    ruta_salida = os.path.join(ruta_export, nombre_salida)
+
+    indice_volumen = []  # Para el índice al final
+    archivos_incluidos = 0
+    archivos_omitidos = []
+
+    # Trabajar sobre descriptores crudos: el contenido de cada .md se
+    # copia con sendfile (kernel→kernel) y los fragmentos pequeños
+    # (encabezado, separadores, índice) se emiten agrupados con writev
+    fd_salida = os.open(ruta_salida, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # Encabezado del Archivo para la IA
+        _escribir_buffers(fd_salida, [
+            f"=== COLECCIÓN: {nombre_proyecto} ===\n".encode('utf-8'),
+            f"=== VOLUMEN: {numero_volumen} de {total_volumenes} ===\n".encode('utf-8'),
+            f"=== CONTENIDO: Transcripciones {inicio+1} a {inicio + len(lote)} ===\n\n".encode('utf-8'),
+        ])
+
+        # Procesar cada archivo del lote
+        ultimo_progreso = 0.0
+        for idx, archivo in enumerate(lote):
+            # Indicador de progreso, refrescado como mucho ~20 veces por
+            # segundo: un print por archivo pesa más que la copia en sí
+            ahora = time.monotonic()
+            if ahora - ultimo_progreso > INTERVALO_PROGRESO:
+                print(f"   Procesando volumen {numero_volumen}: {idx+1}/{len(lote)}...", end='\r')
+                ultimo_progreso = ahora
+
+            ruta_completa = os.path.join(ruta_biblioteca, archivo)
+            try:
+                fd_entrada = os.open(ruta_completa, os.O_RDONLY)
+                try:
+                    tam = os.fstat(fd_entrada).st_size
+                    # Anunciar lectura secuencial completa para que el
+                    # kernel encole el prefetch del archivo entero
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(fd_entrada, 0, tam, os.POSIX_FADV_WILLNEED)
+
+                    # Mirar solo la cabecera: los archivos no válidos
+                    # se descartan sin pagar la lectura completa
+                    cabeza = os.pread(fd_entrada, 512, 0)
+
+                    # Validar que es un archivo procesado por limpiar.py
+                    if not validar_archivo_procesado(cabeza):
+                        archivos_omitidos.append(archivo)
+                        continue
+
+                    # Extraer título para el índice
+                    titulo = extraer_titulo_de_contenido(cabeza)
+                    indice_volumen.append(f"{inicio + archivos_incluidos + 1}. {titulo}")
+
+                    # Copia directa archivo→volumen
+                    _copiar_contenido(fd_salida, fd_entrada, tam)
+                    archivos_incluidos += 1
+
+                    # Agregar separador solo si NO es el último archivo
+                    if idx < len(lote) - 1:
+                        os.write(fd_salida, SEPARADOR_BYTES)
+                finally:
+                    os.close(fd_entrada)
+
+            except Exception as e:
+                print(f"\n⚠️ Error leyendo {archivo}: {e}")
+                archivos_omitidos.append(archivo)
+
+        # Agregar índice al final del volumen
+        if indice_volumen:
+            _escribir_buffers(fd_salida, [
+                LINEA_DOBLE_BYTES,
+                TITULO_INDICE_BYTES,
+                LINEA_SIMPLE_BYTES,
+                "\n".join(indice_volumen).encode('utf-8'),
+                b"\n",
+            ])
+    finally:
+        os.close(fd_salida)
+
+    return nombre_salida, archivos_incluidos, archivos_omitidos
 
 
 def consolidar_proyectos(base_dir=None):
@@ -56,15 +198,13 @@ def consolidar_proyectos(base_dir=None):
     print(f"📂 Salida: {CARPETA_EXPORTACION}/")
     print(f"⚙️  Configuración: ~{TRANSCRIPCIONES_POR_TXT} transcripciones por volumen.\n")
 
-    # Manifest para tracking
-    manifest = {
-        "generated_at": datetime.now().isoformat(),
-        "base_directory": base_dir,
-        "projects": {}
-    }
+    # Manifest para tracking: las entradas se acumulan en una lista y el
+    # dict se arma una sola vez al final, con el tamaño ya conocido
+    generado_en = datetime.now().isoformat()
+    entradas_proyectos = []
 
-    # Escanear carpetas de proyectos
-    proyectos = [f.path for f in os.scandir(base_dir) if f.is_dir()]
+    # Escanear carpetas de proyectos (sin stat extra por symlinks)
+    proyectos = [f.path for f in os.scandir(base_dir) if f.is_dir(follow_symlinks=False)]
 
     for proyecto in proyectos:
         nombre_proyecto = os.path.basename(proyecto)
@@ -80,10 +220,12 @@ def consolidar_proyectos(base_dir=None):
             continue
 
         # 1. Obtener archivos .md limpios
-        # NOTA: El ordenamiento alfabético funciona como cronológico porque
-        # limpiar.py genera nombres con formato YYYYMMDD_titulo [IDIOMA].md
-        archivos_md = [f for f in os.listdir(ruta_biblioteca) if f.endswith(".md")]
-        archivos_md.sort()  # Orden cronológico por prefijo YYYYMMDD_
+        # NOTA: El orden por nombre completo funciona como cronológico porque
+        # limpiar.py genera nombres con formato YYYYMMDD_titulo [IDIOMA].md,
+        # y además desempata de forma determinista los videos del mismo día
+        with os.scandir(ruta_biblioteca) as it:
+            archivos_md = [e.name for e in it if e.is_file() and e.name.endswith(".md")]
+        archivos_md.sort()
 
         if not archivos_md:
             print(f"💨 {nombre_proyecto}: Biblioteca vacía (ejecuta limpiar.py primero).")
@@ -100,85 +242,57 @@ def consolidar_proyectos(base_dir=None):
         volumenes_generados = []
         archivos_omitidos = []
 
-        # 3. Generar los volúmenes
+        # 3. Generar los volúmenes en paralelo: cada volumen es independiente
+        # y está dominado por I/O, así que los hilos solapan lecturas y
+        # escrituras entre volúmenes mientras liberan el GIL
+        trabajos = []
         for i in range(total_volumenes):
             inicio = i * TRANSCRIPCIONES_POR_TXT
             fin = inicio + TRANSCRIPCIONES_POR_TXT
-            lote = archivos_md[inicio:fin]
-
-            numero_volumen = i + 1
-            nombre_salida = f"{nombre_proyecto}_Vol{numero_volumen:02d}.txt"
-            ruta_salida = os.path.join(ruta_export, nombre_salida)
-
-            textos_unidos = []
-            indice_volumen = []  # Para el índice al final
-            archivos_incluidos = 0
-
-            # Encabezado del Archivo para la IA
-            textos_unidos.append(f"=== COLECCIÓN: {nombre_proyecto} ===\n")
-            textos_unidos.append(f"=== VOLUMEN: {numero_volumen} de {total_volumenes} ===\n")
-            textos_unidos.append(f"=== CONTENIDO: Transcripciones {inicio+1} a {inicio + len(lote)} ===\n\n")
-
-            # Procesar cada archivo del lote
-            for idx, archivo in enumerate(lote):
-                # Indicador de progreso
-                print(f"   Procesando volumen {numero_volumen}: {idx+1}/{len(lote)}...", end='\r')
-
-                ruta_completa = os.path.join(ruta_biblioteca, archivo)
-                try:
-                    with open(ruta_completa, 'r', encoding='utf-8') as f:
-                        contenido = f.read()
-
-                    # Validar que es un archivo procesado por limpiar.py
-                    if not validar_archivo_procesado(contenido):
-                        archivos_omitidos.append(archivo)
-                        continue
-
-                    # Extraer título para el índice
-                    titulo = extraer_titulo_de_contenido(contenido)
-                    indice_volumen.append(f"{inicio + archivos_incluidos + 1}. {titulo}")
-
-                    # Añadir contenido
-                    textos_unidos.append(contenido)
-                    archivos_incluidos += 1
-
-                    # Agregar separador solo si NO es el último archivo
-                    if idx < len(lote) - 1:
-                        textos_unidos.append(SEPARADOR_TRANSCRIPCION)
-
-                except Exception as e:
-                    print(f"\n⚠️ Error leyendo {archivo}: {e}")
-                    archivos_omitidos.append(archivo)
-
-            # Agregar índice al final del volumen
-            if indice_volumen:
-                textos_unidos.append("\n\n" + "="*60 + "\n")
-                textos_unidos.append("=== ÍNDICE DE ESTE VOLUMEN ===\n")
-                textos_unidos.append("="*60 + "\n\n")
-                textos_unidos.append("\n".join(indice_volumen))
-                textos_unidos.append("\n")
-
-            # Escribir archivo final
-            with open(ruta_salida, 'w', encoding='utf-8') as f_out:
-                f_out.write("".join(textos_unidos))
-
+            trabajos.append((i + 1, inicio, archivos_md[inicio:fin]))
+
+        if total_volumenes == 1:
+            resultados = [_generar_volumen(ruta_biblioteca, ruta_export, nombre_proyecto,
+                                           *trabajos[0], total_volumenes)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, total_volumenes)) as pool:
+                resultados = list(pool.map(
+                    lambda trabajo: _generar_volumen(ruta_biblioteca, ruta_export,
+                                                     nombre_proyecto, *trabajo, total_volumenes),
+                    trabajos,
+                ))
+
+        for numero_volumen, (nombre_salida, archivos_incluidos, omitidos) in enumerate(resultados, start=1):
             volumenes_generados.append(nombre_salida)
+            archivos_omitidos.extend(omitidos)
             print(f"   ✅ Volumen {numero_volumen}: {archivos_incluidos} transcripciones" + " "*20)
 
-        # Agregar al manifest
-        manifest["projects"][nombre_proyecto] = {
+        # Agregar al manifest (sin claves con valor None)
+        entrada = {
             "total_transcripciones": total_archivos,
             "volumenes": volumenes_generados,
-            "archivos_omitidos": archivos_omitidos if archivos_omitidos else None
         }
+        if archivos_omitidos:
+            entrada["archivos_omitidos"] = archivos_omitidos
+        entradas_proyectos.append((nombre_proyecto, entrada))
 
         if archivos_omitidos:
             print(f"   ⚠️  {len(archivos_omitidos)} archivos omitidos (no válidos)")
 
-    # Guardar manifest
+    # Guardar manifest: serializar a bytes de una vez y escribir con un
+    # solo write, en vez de los writes incrementales de json.dump
+    manifest = {
+        "generated_at": generado_en,
+        "base_directory": base_dir,
+        "projects": dict(entradas_proyectos),
+    }
     manifest_path = os.path.join(ruta_export, "manifest.json")
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        datos = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+    else:
+        datos = json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(manifest_path, 'wb') as f:
+        f.write(datos)
 
     print(f"\n✨ ¡Listo! Archivos generados en: {CARPETA_EXPORTACION}/")
     print(f"📋 Manifest guardado en: {CARPETA_EXPORTACION}/manifest.json")
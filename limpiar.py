@@ -1,6 +1,12 @@
+import mmap
+import multiprocessing
 import os
 import sys
 import re
+import time
+
+# Segundos mínimos entre actualizaciones del indicador de progreso (~20 Hz)
+INTERVALO_PROGRESO = 0.05
 
 # --- CONFIGURACIÓN ---
 CARPETAS_IGNORAR = {'__pycache__', '.git', '.vscode', 'env', 'venv', '_BIBLIOTECA', '_EXPORTS_NOTEBOOK'}
@@ -19,6 +25,19 @@ MARCADORES_INUTILES = {
 UMBRAL_PAUSA_PARRAFO = 2.5
 
 
+def leer_mmap(ruta):
+    """
+    Mapea un archivo de subtítulos en memoria para evitar el buffer de lectura.
+
+    Para archivos vacíos (mmap no los soporta) cae a una lectura normal.
+    """
+    with open(ruta, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return f.read()
+
+
 def parsear_tiempo_vtt(tiempo_str):
     """Convierte timestamp VTT (HH:MM:SS.mmm) a segundos."""
     try:
@@ -31,29 +50,50 @@ def parsear_tiempo_vtt(tiempo_str):
         return None
 
 
+# Primera letra tras puntuación final; el motor de regex recorre el texto
+# en C en vez del bucle carácter a carácter en Python
+REGEX_CAPITALIZAR = re.compile(r'([.?!]\W*)(\w)', re.S)
+
+
 def capitalizar_oraciones(texto):
     """Capitaliza la primera letra después de . ? ! y al inicio."""
     if not texto:
         return texto
 
     # Capitalizar inicio
-    texto = texto[0].upper() + texto[1:] if len(texto) > 1 else texto.upper()
-
-    # Capitalizar después de puntuación final
-    resultado = []
-    capitalizar_siguiente = False
+    texto = texto[0].upper() + texto[1:]
+
+    # Capitalizar después de puntuación final en una sola pasada
+    return REGEX_CAPITALIZAR.sub(lambda m: m.group(1) + m.group(2).upper(), texto)
+
+
+# Un solo regex compilado extrae (inicio, fin, texto) de cada cue en una
+# pasada en C, en vez de iterar línea por línea en Python.
+REGEX_CUE = re.compile(
+    r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})[^\n]*\n'
+    r'((?:(?!\d{2}:\d{2}:\d{2}\.\d{3})[^\n]*\n?)*)',
+    re.M,
+)
+# Reemplazos de entidades HTML; todo lo demás que matchee CLEAN_RE se borra
+_REEMPLAZOS = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&#39;': "'",
+    '&quot;': '"',
+}
 
-    for i, char in enumerate(texto):
-        if capitalizar_siguiente and char.isalpha():
-            resultado.append(char.upper())
-            capitalizar_siguiente = False
-        else:
-            resultado.append(char)
+# Etiquetas, atributos de posición, entidades y marcadores en una sola
+# alternancia: cada línea pasa por el motor de regex exactamente una vez.
+REGEX_LIMPIEZA = re.compile(
+    r'<[^>]+>|align:\w+|position:\d+%|&nbsp;|&amp;|&#39;|&quot;|'
+    + '|'.join(re.escape(marcador) for marcador in sorted(MARCADORES_INUTILES)),
+    re.IGNORECASE,
+)
+REGEX_ESPACIOS = re.compile(r'\s+')
 
-        if char in '.?!' and i < len(texto) - 1:
-            capitalizar_siguiente = True
 
-    return ''.join(resultado)
+def _limpiar_linea(match):
+    return _REEMPLAZOS.get(match.group(0).lower(), '')
 
 
 def limpiar_texto_vtt(contenido):
@@ -61,108 +101,73 @@ def limpiar_texto_vtt(contenido):
     Limpia el contenido VTT y lo convierte en párrafos coherentes.
     Usa las pausas entre timestamps para detectar cambios de párrafo.
     """
-    regex_tiempo_linea = re.compile(r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})')
-    regex_etiquetas = re.compile(r'<[^>]+>')
-    regex_atributos_linea = re.compile(r'align:\w+|position:\d+%')
-
-    # Primera pasada: extraer bloques con timestamps
-    bloques = []
+    # Primera pasada: extraer bloques con timestamps.
+    # Lista plana de bloques (cada uno una lista de líneas): sin dicts por
+    # bloque ni banderas que nadie lee.
+    bloques_texto = []
     tiempo_actual_fin = None
     texto_bloque_actual = []
-    lineas_vistas = set()
-
-    lineas = contenido.splitlines()
-    i = 0
-
-    while i < len(lineas):
-        linea = lineas[i].strip()
-
-        # Saltar líneas de metadatos
-        if (not linea or
-            linea == "WEBVTT" or
-            linea.startswith("Kind:") or
-            linea.startswith("Language:") or
-            linea.isdigit()):
-            i += 1
-            continue
-
-        # Detectar línea de timestamp
-        match_tiempo = regex_tiempo_linea.search(linea)
-        if match_tiempo:
-            tiempo_inicio = parsear_tiempo_vtt(match_tiempo.group(1))
-            tiempo_fin = parsear_tiempo_vtt(match_tiempo.group(2))
-
-            # Verificar si hay pausa significativa (nuevo párrafo)
-            if tiempo_actual_fin is not None and tiempo_inicio is not None:
-                pausa = tiempo_inicio - tiempo_actual_fin
-                if pausa >= UMBRAL_PAUSA_PARRAFO and texto_bloque_actual:
-                    # Guardar bloque actual y empezar nuevo párrafo
-                    bloques.append({
-                        'texto': texto_bloque_actual.copy(),
-                        'es_nuevo_parrafo': True
-                    })
-                    texto_bloque_actual = []
-                    lineas_vistas = set()
-
-            tiempo_actual_fin = tiempo_fin
-            i += 1
-            continue
-
-        # Procesar línea de texto
-        # Quitar atributos de posición que a veces quedan en la línea
-        linea = regex_atributos_linea.sub('', linea).strip()
-
-        # Quitar etiquetas HTML
-        texto_plano = regex_etiquetas.sub('', linea)
-
-        # Reemplazar entidades HTML
-        texto_plano = (texto_plano
-            .replace('&nbsp;', ' ')
-            .replace('&amp;', '&')
-            .replace('&#39;', "'")
-            .replace('&quot;', '"')
-            .replace('  ', ' ')
-            .strip())
-
-        # Filtrar marcadores inútiles
-        if texto_plano.lower() in MARCADORES_INUTILES:
-            i += 1
-            continue
-
-        # También filtrar si contiene solo un marcador
-        texto_sin_marcador = texto_plano
-        for marcador in MARCADORES_INUTILES:
-            texto_sin_marcador = texto_sin_marcador.lower().replace(marcador, '').strip()
-        if not texto_sin_marcador:
-            i += 1
-            continue
-
-        # Deduplicar
-        if texto_plano and texto_plano not in lineas_vistas:
-            texto_bloque_actual.append(texto_plano)
-            lineas_vistas.add(texto_plano)
-
-        i += 1
+    # Dedup por hash de 64 bits en vez de guardar cada línea completa:
+    # el set solo retiene enteros y no mantiene vivas las cadenas
+    hashes_vistos = set()
+
+    for cue in REGEX_CUE.finditer(contenido):
+        partes_inicio = cue.group(1).split(':')
+        partes_fin = cue.group(2).split(':')
+        tiempo_inicio = (int(partes_inicio[0]) * 3600 +
+                         int(partes_inicio[1]) * 60 +
+                         float(partes_inicio[2]))
+        tiempo_fin = (int(partes_fin[0]) * 3600 +
+                      int(partes_fin[1]) * 60 +
+                      float(partes_fin[2]))
+
+        # Verificar si hay pausa significativa (nuevo párrafo)
+        if tiempo_actual_fin is not None:
+            pausa = tiempo_inicio - tiempo_actual_fin
+            if pausa >= UMBRAL_PAUSA_PARRAFO and texto_bloque_actual:
+                # Guardar bloque actual y empezar nuevo párrafo
+                bloques_texto.append(texto_bloque_actual)
+                texto_bloque_actual = []
+                hashes_vistos = set()
+
+        tiempo_actual_fin = tiempo_fin
+
+        # Limpiar el bloque entero del cue de una vez: una sola invocación
+        # del motor de regex por cue en lugar de una por línea
+        texto_cue = REGEX_LIMPIEZA.sub(_limpiar_linea, cue.group(3))
+
+        for linea in texto_cue.splitlines():
+            linea = linea.strip()
+
+            # Saltar restos de metadatos e identificadores de cue
+            if (not linea or
+                linea == "WEBVTT" or
+                linea.startswith("Kind:") or
+                linea.startswith("Language:") or
+                linea.isdigit()):
+                continue
+
+            texto_plano = REGEX_ESPACIOS.sub(' ', linea).strip()
+            if not texto_plano:
+                continue
+
+            # Deduplicar
+            if texto_plano:
+                hash_linea = hash(texto_plano)
+                if hash_linea not in hashes_vistos:
+                    texto_bloque_actual.append(texto_plano)
+                    hashes_vistos.add(hash_linea)
 
     # Agregar último bloque
     if texto_bloque_actual:
-        bloques.append({
-            'texto': texto_bloque_actual,
-            'es_nuevo_parrafo': False
-        })
+        bloques_texto.append(texto_bloque_actual)
 
     # Segunda pasada: unir líneas en párrafos
     parrafos = []
 
-    for bloque in bloques:
-        if not bloque['texto']:
-            continue
-
+    for texto_bloque in bloques_texto:
         # Unir todas las líneas del bloque en un párrafo
-        parrafo = ' '.join(bloque['texto'])
-
-        # Limpiar espacios múltiples
-        parrafo = re.sub(r'\s+', ' ', parrafo).strip()
+        parrafo = ' '.join(texto_bloque).strip()
 
         if parrafo:
             parrafos.append(parrafo)
@@ -177,19 +182,58 @@ def limpiar_texto_vtt(contenido):
 
 
 def obtener_info_archivo(nombre_archivo):
-    idioma = "ES"
-    if ".en." in nombre_archivo.lower() or "_en." in nombre_archivo.lower():
-        idioma = "EN"
-    elif ".es." in nombre_archivo.lower() or "_es." in nombre_archivo.lower():
-        idioma = "ES"
+    # Una sola pasada de lower() en vez de repetirla en cada comprobación
+    minusculas = nombre_archivo.lower()
+    idioma = "EN" if (".en." in minusculas or "_en." in minusculas) else "ES"
     nombre_base = os.path.splitext(os.path.splitext(nombre_archivo)[0])[0]
     return nombre_base, idioma
 
 
+def _procesar_un_archivo(tarea):
+    """
+    Limpia un archivo de subtítulos y devuelve la salida lista para escribir.
+
+    Recibe una tupla (ruta_origen, archivo, raiz) y devuelve
+    (archivo, ruta_salida, contenido_md, error). Si el archivo no produce
+    texto útil, ruta_salida y contenido_md son None.
+    """
+    ruta_origen, archivo, raiz = tarea
+    try:
+        crudo = leer_mmap(ruta_origen)
+        try:
+            contenido_raw = bytes(crudo).decode('utf-8', errors='ignore')
+        finally:
+            if isinstance(crudo, mmap.mmap):
+                crudo.close()
+
+        texto_limpio = limpiar_texto_vtt(contenido_raw)
+        if not texto_limpio:
+            return archivo, None, None, None
+
+        nombre_base, idioma = obtener_info_archivo(archivo)
+        nombre_salida = f"{nombre_base} [{idioma}].md"
+        ruta_salida = os.path.join(raiz, NOMBRE_CARPETA_BIBLIOTECA, nombre_salida)
+
+        contenido_md = (
+            f"# {nombre_base}\n"
+            f"**Idioma:** {idioma}\n"
+            f"**Fuente:** {archivo}\n"
+            "---\n\n"
+            f"{texto_limpio}"
+        )
+        return archivo, ruta_salida, contenido_md, None
+    except Exception as e:
+        return archivo, None, None, str(e)
+
+
 def procesar_directorio(base_dir=None):
     """
     Procesa todos los archivos VTT/SRT en el directorio y sus subdirectorios.
 
+    La limpieza de cada archivo es independiente y está limitada por CPU,
+    así que se reparte entre procesos con multiprocessing.Pool; la escritura
+    se hace siempre en el proceso padre.
+
     Args:
         base_dir: Directorio base donde buscar archivos.
                   Si es None, usa el directorio actual.
@@ -208,66 +252,72 @@ def procesar_directorio(base_dir=None):
     contador = 0
     errores = 0
 
-    # Primero contar total de archivos para progreso
-    total_archivos = 0
-    for raiz, dirs, archivos in os.walk(base_dir):
-        dirs[:] = [d for d in dirs if d not in CARPETAS_IGNORAR]
-        if NOMBRE_CARPETA_BIBLIOTECA in raiz:
-            continue
-        total_archivos += sum(1 for a in archivos if a.endswith(EXTENSIONES_SUBS))
-
-    print(f"📊 Encontrados {total_archivos} archivos para procesar.\n")
-
+    # Recolectar tareas con un solo recorrido del árbol; el total para el
+    # progreso sale de la lista de tareas, sin un walk extra de conteo
+    tareas = []
     for raiz, dirs, archivos in os.walk(base_dir):
         dirs[:] = [d for d in dirs if d not in CARPETAS_IGNORAR]
 
         if NOMBRE_CARPETA_BIBLIOTECA in raiz:
             continue
 
-        # Obtener nombre del proyecto actual
         proyecto_actual = os.path.basename(raiz) if raiz != base_dir else "raíz"
 
         archivos_subs = [a for a in archivos if a.endswith(EXTENSIONES_SUBS)]
         if archivos_subs:
-            print(f"📦 Procesando: {proyecto_actual} ({len(archivos_subs)} archivos)")
-
-        for idx, archivo in enumerate(archivos_subs):
-            # Indicador de progreso
-            print(f"   {idx+1}/{len(archivos_subs)}: {archivo[:50]}...", end='\r')
-
-            ruta_origen = os.path.join(raiz, archivo)
-            try:
-                with open(ruta_origen, 'r', encoding='utf-8', errors='ignore') as f:
-                    contenido_raw = f.read()
-
-                texto_limpio = limpiar_texto_vtt(contenido_raw)
-                if not texto_limpio:
-                    continue
-
-                nombre_base, idioma = obtener_info_archivo(archivo)
-
-                # Guardar en _BIBLIOTECA
-                carpeta_salida = os.path.join(raiz, NOMBRE_CARPETA_BIBLIOTECA)
-                if not os.path.exists(carpeta_salida):
-                    os.makedirs(carpeta_salida)
-
-                nombre_salida = f"{nombre_base} [{idioma}].md"
-                ruta_salida = os.path.join(carpeta_salida, nombre_salida)
-
-                with open(ruta_salida, 'w', encoding='utf-8') as f_out:
-                    f_out.write(f"# {nombre_base}\n")
-                    f_out.write(f"**Idioma:** {idioma}\n")
-                    f_out.write(f"**Fuente:** {archivo}\n")
-                    f_out.write("---\n\n")
-                    f_out.write(texto_limpio)
-
-                contador += 1
-            except Exception as e:
-                print(f"\n❌ Error en {archivo}: {e}")
-                errores += 1
-
-        if archivos_subs:
-            print(f"   ✅ {proyecto_actual}: {len(archivos_subs)} archivos procesados" + " "*30)
+            print(f"📦 Encolando: {proyecto_actual} ({len(archivos_subs)} archivos)")
+
+        for archivo in archivos_subs:
+            tareas.append((os.path.join(raiz, archivo), archivo, raiz))
+
+    print(f"\n📊 Encontrados {len(tareas)} archivos para procesar.\n")
+
+    ultimo_progreso = 0.0
+    # Un fd de directorio por carpeta _BIBLIOTECA: los archivos de salida se
+    # abren relativos al fd (dir_fd), sin resolver la ruta completa por archivo
+    fds_salida = {}
+
+    def _escribir_resultado(resultado):
+        nonlocal contador, errores, ultimo_progreso
+        archivo, ruta_salida, contenido_md, error = resultado
+        if error is not None:
+            print(f"\n❌ Error en {archivo}: {error}")
+            errores += 1
+            return
+        if ruta_salida is None:
+            return
+
+        carpeta_salida = os.path.dirname(ruta_salida)
+        dir_fd = fds_salida.get(carpeta_salida)
+        if dir_fd is None:
+            os.makedirs(carpeta_salida, exist_ok=True)
+            dir_fd = os.open(carpeta_salida, os.O_RDONLY | os.O_DIRECTORY)
+            fds_salida[carpeta_salida] = dir_fd
+
+        fd = os.open(os.path.basename(ruta_salida),
+                     os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+        with open(fd, 'w', encoding='utf-8') as f_out:
+            f_out.write(contenido_md)
+        contador += 1
+        # Refrescar el progreso como mucho ~20 veces por segundo: con miles
+        # de archivos pequeños el print por archivo domina sobre la limpieza
+        ahora = time.monotonic()
+        if ahora - ultimo_progreso > INTERVALO_PROGRESO:
+            print(f"   {contador}/{len(tareas)}: {archivo[:50]}...", end='\r')
+            ultimo_progreso = ahora
+
+    # Para pocos archivos el costo de arrancar procesos no compensa
+    try:
+        if len(tareas) < 4:
+            for tarea in tareas:
+                _escribir_resultado(_procesar_un_archivo(tarea))
+        else:
+            with multiprocessing.Pool(os.cpu_count()) as pool:
+                for resultado in pool.imap_unordered(_procesar_un_archivo, tareas, chunksize=8):
+                    _escribir_resultado(resultado)
+    finally:
+        for dir_fd in fds_salida.values():
+            os.close(dir_fd)
 
     print(f"\n✨ [LIMPIAR] Fin.")
     print(f"   ✅ Procesados: {contador}")
@@ -0,0 +1,74 @@
+# tests/conftest.py
+"""Shared fixtures for the test suite."""
+
+import io
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+
+import pytest
+import typer
+import typer.testing
+from typer.main import get_command
+from typer.testing import CliRunner
+
+from ytrag.main import app
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """CliRunner that converts the Typer app to Click only once.
+
+    CliRunner.invoke rebuilds the whole Click command tree from the Typer
+    app on every call; this memoizes the conversion per app instance for
+    the duration of the session.
+    """
+    converted = {}
+    real_get_command = typer.testing._get_command
+
+    def cached_get_command(typer_instance):
+        key = id(typer_instance)
+        if key not in converted:
+            converted[key] = real_get_command(typer_instance)
+        return converted[key]
+
+    typer.testing._get_command = cached_get_command
+    try:
+        yield CliRunner()
+    finally:
+        typer.testing._get_command = real_get_command
+
+
+@pytest.fixture(scope="session")
+def click_app():
+    """The Typer app converted to a Click group, for attribute-level checks."""
+    return get_command(app)
+
+
+@pytest.fixture(scope="session")
+def cli_help():
+    """Memoized `ytrag [command] --help` output.
+
+    Renders help straight from the Click command objects instead of going
+    through CliRunner, skipping the runner's parsing, stdout-capture and
+    exit-code machinery, and caches one render per command for the whole
+    session. The result mimics the runner's interface (exit_code, stdout).
+    """
+    root = get_command(app)
+    cache = {}
+
+    def _help(*args):
+        if args not in cache:
+            cmd = root
+            for name in args:
+                cmd = cmd.commands[name]
+            buffer = io.StringIO()
+            with redirect_stdout(buffer):
+                with typer.Context(cmd, info_name=" ".join(("ytrag",) + args)) as ctx:
+                    rendered = cmd.get_help(ctx)
+            cache[args] = SimpleNamespace(
+                exit_code=0,
+                stdout=buffer.getvalue() + (rendered or ""),
+            )
+        return cache[args]
+
+    return _help
@@ -0,0 +1,33 @@
+# tests/test_cache.py
+"""Tests for the channel metadata cache."""
+
+import pytest
+
+from ytrag import cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the cache at a throwaway directory."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+
+class TestChannelCache:
+    """Tests for the TTL cache."""
+
+    def test_returns_none_for_missing_key(self):
+        """Should miss cleanly when nothing was stored."""
+        assert cache.get('https://youtube.com/@missing') is None
+
+    def test_round_trips_stored_value(self):
+        """Should return the stored dict before it expires."""
+        info = {'channel': 'Test', 'video_count': 3}
+        cache.set('https://youtube.com/@test', info)
+
+        assert cache.get('https://youtube.com/@test') == info
+
+    def test_expired_entry_misses(self):
+        """Should treat entries past their TTL as missing."""
+        cache.set('https://youtube.com/@old', {'channel': 'Old'}, ttl=-1)
+
+        assert cache.get('https://youtube.com/@old') is None
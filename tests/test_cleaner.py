@@ -1,10 +1,6 @@
 # tests/test_cleaner.py
 """Tests for VTT cleaner module."""
 
-import pytest
-from pathlib import Path
-import tempfile
-
 from ytrag.cleaner import (
     parse_vtt_timestamp,
     clean_vtt_content,
@@ -107,118 +103,104 @@ class TestCapitalizeSentences:
 class TestProcessVTTFile:
     """Tests for single file processing."""
 
-    def test_processes_valid_vtt(self):
+    def test_processes_valid_vtt(self, tmp_path):
         """Should process valid VTT file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            vtt_path = Path(tmpdir) / "20240101_Test Video.en.vtt"
-            vtt_path.write_text("WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nhello world")
+        vtt_path = tmp_path / "20240101_Test Video.en.vtt"
+        vtt_path.write_text("WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nhello world")
 
-            result = process_vtt_file(vtt_path, "Test Channel")
+        result = process_vtt_file(vtt_path, "Test Channel")
 
-            assert result is not None
-            assert result['base_name'] == "20240101_Test Video"
-            assert result['language'] == "EN"
-            assert "hello world" in result['content'].lower()
-            assert result['channel'] == "Test Channel"
+        assert result is not None
+        assert result['base_name'] == "20240101_Test Video"
+        assert result['language'] == "EN"
+        assert "hello world" in result['content'].lower()
+        assert result['channel'] == "Test Channel"
 
-    def test_returns_none_for_empty_content(self):
+    def test_returns_none_for_empty_content(self, tmp_path):
         """Should return None for empty VTT."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            vtt_path = Path(tmpdir) / "empty.en.vtt"
-            vtt_path.write_text("WEBVTT\n\n")
+        vtt_path = tmp_path / "empty.en.vtt"
+        vtt_path.write_text("WEBVTT\n\n")
 
-            result = process_vtt_file(vtt_path, "Test Channel")
-            assert result is None
+        result = process_vtt_file(vtt_path, "Test Channel")
+        assert result is None
 
 
 class TestProcessVTTDirectory:
     """Tests for directory processing."""
 
-    def test_processes_multiple_files(self):
+    def test_processes_multiple_files(self, tmp_path):
         """Should process all VTT files in directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Create test files
-            (tmpdir / "20240101_Video1.en.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nfirst video"
-            )
-            (tmpdir / "20240102_Video2.en.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nsecond video"
-            )
+        # Create test files
+        (tmp_path / "20240101_Video1.en.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nfirst video"
+        )
+        (tmp_path / "20240102_Video2.en.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nsecond video"
+        )
 
-            results = process_vtt_directory(tmpdir, "Test Channel")
+        results = process_vtt_directory(tmp_path, "Test Channel")
 
-            assert len(results) == 2
-            assert results[0]['base_name'] == "20240101_Video1"
-            assert results[1]['base_name'] == "20240102_Video2"
+        assert len(results) == 2
+        assert results[0]['base_name'] == "20240101_Video1"
+        assert results[1]['base_name'] == "20240102_Video2"
 
-    def test_deduplicates_regional_variants(self):
+    def test_deduplicates_regional_variants(self, tmp_path):
         """Should skip regional variant if non-regional exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-
-            # Create both regional and non-regional
-            (tmpdir / "20240101_Video.en.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nnon-regional"
-            )
-            (tmpdir / "20240101_Video.en-US.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nregional"
-            )
+        # Create both regional and non-regional
+        (tmp_path / "20240101_Video.en.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nnon-regional"
+        )
+        (tmp_path / "20240101_Video.en-US.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nregional"
+        )
 
-            results = process_vtt_directory(tmpdir, "Test Channel")
+        results = process_vtt_directory(tmp_path, "Test Channel")
 
-            assert len(results) == 1
-            assert "non-regional" in results[0]['content'].lower()
+        assert len(results) == 1
+        assert "non-regional" in results[0]['content'].lower()
 
-    def test_prefers_requested_language_when_deduplicating(self):
+    def test_prefers_requested_language_when_deduplicating(self, tmp_path):
         """Should keep the requested language when multiple languages exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            (tmpdir / "20240101_Video.en.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nenglish"
-            )
-            (tmpdir / "20240101_Video.es.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nespanol"
-            )
-
-            results = process_vtt_directory(tmpdir, "Test Channel", preferred_langs=["es"])
-
-            assert len(results) == 1
-            assert results[0]['language'] == "ES"
-            assert "espanol" in results[0]['content'].lower()
-
-    def test_prefers_majority_language_when_no_language_requested(self):
+        (tmp_path / "20240101_Video.en.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nenglish"
+        )
+        (tmp_path / "20240101_Video.es.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nespanol"
+        )
+
+        results = process_vtt_directory(tmp_path, "Test Channel", preferred_langs=["es"])
+
+        assert len(results) == 1
+        assert results[0]['language'] == "ES"
+        assert "espanol" in results[0]['content'].lower()
+
+    def test_prefers_majority_language_when_no_language_requested(self, tmp_path):
         """Should use the majority subtitle language as default preference."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            (tmpdir / "20240101_Video.en.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nenglish"
-            )
-            (tmpdir / "20240101_Video.es.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nespanol"
-            )
-            (tmpdir / "20240102_Another.es.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\notro"
-            )
-
-            results = process_vtt_directory(tmpdir, "Test Channel")
-
-            assert len(results) == 2
-            assert results[0]['language'] == "ES"
-
-    def test_falls_back_when_requested_language_is_missing(self):
+        (tmp_path / "20240101_Video.en.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nenglish"
+        )
+        (tmp_path / "20240101_Video.es.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nespanol"
+        )
+        (tmp_path / "20240102_Another.es.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\notro"
+        )
+
+        results = process_vtt_directory(tmp_path, "Test Channel")
+
+        assert len(results) == 2
+        assert results[0]['language'] == "ES"
+
+    def test_falls_back_when_requested_language_is_missing(self, tmp_path):
         """Should keep another available language if the requested one is absent."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            (tmpdir / "20240101_Video.en.vtt").write_text(
-                "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nenglish"
-            )
+        (tmp_path / "20240101_Video.en.vtt").write_text(
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nenglish"
+        )
 
-            results = process_vtt_directory(tmpdir, "Test Channel", preferred_langs=["es"])
+        results = process_vtt_directory(tmp_path, "Test Channel", preferred_langs=["es"])
 
-            assert len(results) == 1
-            assert results[0]['language'] == "EN"
+        assert len(results) == 1
+        assert results[0]['language'] == "EN"
 
 
 class TestChoosePreferredLanguage:
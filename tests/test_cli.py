@@ -1,47 +1,47 @@
 # tests/test_cli.py
 """Tests for CLI interface."""
 
+import os
+
 import pytest
-from typer.testing import CliRunner
+import typer
 from pathlib import Path
 
-from ytrag.main import app, build_output_paths, extract_download_progress, should_prompt
-
-runner = CliRunner()
+from ytrag import __version__
+from ytrag.main import app, build_output_paths, extract_download_progress, should_prompt, version_callback
 
 
 class TestCLI:
     """Tests for CLI commands."""
 
-    def test_version(self):
+    def test_version(self, capsys):
         """Should show version."""
-        result = runner.invoke(app, ["--version"])
-        assert result.exit_code == 0
-        assert "ytrag version" in result.stdout
+        with pytest.raises(typer.Exit):
+            version_callback(True)
+        assert f"ytrag version {__version__}" in capsys.readouterr().out
 
-    def test_help(self):
+    def test_help(self, cli_help):
         """Should show help."""
-        result = runner.invoke(app, ["--help"])
+        result = cli_help()
         assert result.exit_code == 0
         assert "ytrag" in result.stdout.lower()
 
-    def test_all_command_exists(self):
+    def test_all_command_exists(self, click_app):
         """Should have all command."""
-        result = runner.invoke(app, ["all", "--help"])
-        assert result.exit_code == 0
-        assert "YouTube URL" in result.stdout
+        cmd = click_app.commands["all"]
+        assert any("YouTube URL" in (param.help or "") for param in cmd.params)
 
-    def test_all_command_exposes_rate_limit_options(self):
+    def test_all_command_exposes_rate_limit_options(self, cli_help):
         """Should expose controls for large channel rate limiting."""
-        result = runner.invoke(app, ["all", "--help"])
+        result = cli_help("all")
         assert result.exit_code == 0
         assert "--sleep-interval" in result.stdout
         assert "--stop-after-errors" in result.stdout
         assert "--rate-limit-retries" in result.stdout
 
-    def test_all_command_exposes_notebooklm_export_options(self):
+    def test_all_command_exposes_notebooklm_export_options(self, cli_help):
         """Should expose NotebookLM-oriented export options."""
-        result = runner.invoke(app, ["all", "--help"])
+        result = cli_help("all")
         assert result.exit_code == 0
         assert "--target-volumes" in result.stdout
         assert "--per-volume" in result.stdout
@@ -50,26 +50,25 @@ class TestCLI:
         assert "--interactive" in result.stdout
         assert "--no-interactive" in result.stdout
 
-    def test_status_command_exists(self):
+    def test_status_command_exists(self, click_app):
         """Should have status command."""
-        result = runner.invoke(app, ["status", "--help"])
-        assert result.exit_code == 0
+        assert "status" in click_app.commands
 
-    def test_rebuild_command_exists(self):
+    def test_rebuild_command_exists(self, cli_help):
         """Should expose a command for rebuilding volumes from local VTT files."""
-        result = runner.invoke(app, ["rebuild", "--help"])
+        result = cli_help("rebuild")
         assert result.exit_code == 0
         assert "VTT" in result.stdout
 
-    def test_rebuild_command_exposes_export_options(self):
+    def test_rebuild_command_exposes_export_options(self, cli_help):
         """Should expose the same export controls for rebuild."""
-        result = runner.invoke(app, ["rebuild", "--help"])
+        result = cli_help("rebuild")
         assert result.exit_code == 0
         assert "--target-volumes" in result.stdout
         assert "--keep-raw" in result.stdout
         assert "--source-marker-freq" in result.stdout
 
-    def test_status_detects_new_rag_volume_folder(self, tmp_path):
+    def test_status_detects_new_rag_volume_folder(self, runner, tmp_path):
         """Should detect volumes in the new rag-volumes layout."""
         volumes_dir = tmp_path / "ytrag-TestChannel" / "rag-volumes"
         volumes_dir.mkdir(parents=True)
@@ -81,7 +80,8 @@ class TestCLI:
         assert "ytrag-TestChannel" in result.stdout
         assert "Volumes: 1" in result.stdout
 
-    def test_rebuild_uses_target_volumes_and_does_not_keep_raw_by_default(self, tmp_path):
+    @pytest.mark.slow
+    def test_rebuild_uses_target_volumes_and_does_not_keep_raw_by_default(self, runner, tmp_path):
         """Should calculate volume size from target volumes and omit raw output by default."""
         source = tmp_path / "source"
         source.mkdir()
@@ -105,12 +105,14 @@ class TestCLI:
         )
 
         project = tmp_path / "ytrag-Test Channel"
-        volumes = list((project / "rag-volumes").glob("*_Vol*.txt"))
+        volumes = [e.name for e in os.scandir(project / "rag-volumes")
+                   if "_Vol" in e.name and e.name.endswith(".txt")]
         assert result.exit_code == 0
         assert len(volumes) == 5
         assert not (project / "raw-subtitles").exists()
 
-    def test_rebuild_per_volume_overrides_target_volumes_and_can_keep_raw(self, tmp_path):
+    @pytest.mark.slow
+    def test_rebuild_per_volume_overrides_target_volumes_and_can_keep_raw(self, runner, tmp_path):
         """Should let per-volume override target volume calculation and keep raw on request."""
         source = tmp_path / "source"
         source.mkdir()
@@ -137,8 +139,10 @@ class TestCLI:
         )
 
         project = tmp_path / "ytrag-Test Channel"
-        volumes = list((project / "rag-volumes").glob("*_Vol*.txt"))
-        raw_files = list((project / "raw-subtitles").glob("*.vtt"))
+        volumes = [e.name for e in os.scandir(project / "rag-volumes")
+                   if "_Vol" in e.name and e.name.endswith(".txt")]
+        raw_files = [e.name for e in os.scandir(project / "raw-subtitles")
+                     if e.name.endswith(".vtt")]
         assert result.exit_code == 0
         assert len(volumes) == 3
         assert len(raw_files) == 10
@@ -3,8 +3,6 @@
 
 import pytest
 import json
-from pathlib import Path
-import tempfile
 
 from ytrag.consolidator import (
     TRANSCRIPTS_PER_VOLUME,
@@ -36,13 +34,16 @@ class TestFormatTranscript:
         transcript = make_transcript("20240101_Test Video")
         result = format_transcript(transcript)
 
-        assert "## 2024-01-01 · Test Video" in result
-        assert "**Idioma:** EN" in result
-        assert "**Canal:** Test Channel" in result
-        assert "**Fecha:** 2024-01-01" in result
-        assert "**Video:** Test Video" in result
-        assert "**Archivo fuente:** 20240101_Test Video.en.vtt" in result
-        assert "Test content" in result
+        needles = (
+            "## 2024-01-01 · Test Video",
+            "**Idioma:** EN",
+            "**Canal:** Test Channel",
+            "**Fecha:** 2024-01-01",
+            "**Video:** Test Video",
+            "**Archivo fuente:** 20240101_Test Video.en.vtt",
+            "Test content",
+        )
+        assert all(needle in result for needle in needles)
 
     def test_repeats_source_marker_every_three_paragraphs(self):
         """Should keep source metadata near cited text."""
@@ -95,162 +96,133 @@ class TestCreateVolumes:
         """Should keep default volumes small enough for large channels."""
         assert TRANSCRIPTS_PER_VOLUME == 50
 
-    def test_creates_single_volume(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def volume_run(tmp_path_factory):
+        """One shared consolidation run for the read-only volume assertions."""
+        output_dir = tmp_path_factory.mktemp("volumes")
+        transcripts = [
+            make_transcript("20240101_First"),
+            make_transcript("20240102_Second"),
+        ]
+        stats = create_volumes(
+            transcripts=transcripts,
+            output_dir=output_dir,
+            channel_name="TestChannel",
+            transcripts_per_volume=100,
+        )
+        content = (output_dir / "TestChannel_Vol01.txt").read_text()
+        return {'output_dir': output_dir, 'stats': stats, 'content': content}
+
+    def test_creates_single_volume(self, volume_run):
         """Should create single volume for small batch."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            transcripts = [make_transcript(f"video{i}") for i in range(5)]
-
-            stats = create_volumes(
-                transcripts=transcripts,
-                output_dir=output_dir,
-                channel_name="TestChannel",
-                transcripts_per_volume=100,
-            )
-
-            assert stats['total'] == 5
-            assert len(stats['volumes']) == 1
-            assert (output_dir / "TestChannel_Vol01.txt").exists()
-
-    def test_creates_multiple_volumes(self):
+        assert volume_run['stats']['total'] == 2
+        assert len(volume_run['stats']['volumes']) == 1
+        assert (volume_run['output_dir'] / "TestChannel_Vol01.txt").exists()
+
+    def test_creates_multiple_volumes(self, tmp_path):
         """Should split into multiple volumes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            transcripts = [make_transcript(f"video{i}") for i in range(25)]
-
-            stats = create_volumes(
-                transcripts=transcripts,
-                output_dir=output_dir,
-                channel_name="TestChannel",
-                transcripts_per_volume=10,
-            )
-
-            assert stats['total'] == 25
-            assert len(stats['volumes']) == 3
-            assert (output_dir / "TestChannel_Vol01.txt").exists()
-            assert (output_dir / "TestChannel_Vol02.txt").exists()
-            assert (output_dir / "TestChannel_Vol03.txt").exists()
-
-    def test_volume_has_header(self):
+        transcripts = [make_transcript(f"video{i}") for i in range(25)]
+
+        stats = create_volumes(
+            transcripts=transcripts,
+            output_dir=tmp_path,
+            channel_name="TestChannel",
+            transcripts_per_volume=10,
+        )
+
+        assert stats['total'] == 25
+        assert len(stats['volumes']) == 3
+        assert (tmp_path / "TestChannel_Vol01.txt").exists()
+        assert (tmp_path / "TestChannel_Vol02.txt").exists()
+        assert (tmp_path / "TestChannel_Vol03.txt").exists()
+
+    def test_volume_has_header(self, volume_run):
         """Should include volume header."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            transcripts = [make_transcript("video1")]
-
-            create_volumes(
-                transcripts=transcripts,
-                output_dir=output_dir,
-                channel_name="TestChannel",
-            )
+        needles = ("=== COLECCIÓN: TestChannel ===", "=== VOLUMEN: 1 de 1 ===")
+        assert all(needle in volume_run['content'] for needle in needles)
 
-            content = (output_dir / "TestChannel_Vol01.txt").read_text()
-            assert "=== COLECCIÓN: TestChannel ===" in content
-            assert "=== VOLUMEN: 1 de 1 ===" in content
-
-    def test_volume_has_index(self):
+    def test_volume_has_index(self, volume_run):
         """Should include index at end."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            transcripts = [
-                make_transcript("20240101_First"),
-                make_transcript("20240102_Second"),
-            ]
-
-            create_volumes(
-                transcripts=transcripts,
-                output_dir=output_dir,
-                channel_name="TestChannel",
-            )
-
-            content = (output_dir / "TestChannel_Vol01.txt").read_text()
-            assert "=== ÍNDICE DE ESTE VOLUMEN ===" in content
-            assert "1. 20240101_First" in content
-            assert "2. 20240102_Second" in content
-
-    def test_handles_empty_transcripts(self):
+        needles = (
+            "=== ÍNDICE DE ESTE VOLUMEN ===",
+            "1. 20240101_First",
+            "2. 20240102_Second",
+        )
+        assert all(needle in volume_run['content'] for needle in needles)
+
+    def test_handles_empty_transcripts(self, tmp_path):
         """Should handle empty transcript list."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-
-            stats = create_volumes(
-                transcripts=[],
-                output_dir=output_dir,
-                channel_name="TestChannel",
-            )
+        stats = create_volumes(
+            transcripts=[],
+            output_dir=tmp_path,
+            channel_name="TestChannel",
+        )
 
-            assert stats['total'] == 0
-            assert stats['volumes'] == []
+        assert stats['total'] == 0
+        assert stats['volumes'] == []
 
-    def test_removes_stale_volume_files_before_writing(self):
+    def test_removes_stale_volume_files_before_writing(self, tmp_path):
         """Should not leave old volume files from a previous export."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            (output_dir / "TestChannel_Vol99.txt").write_text("stale")
-            transcripts = [make_transcript("video1")]
+        (tmp_path / "TestChannel_Vol99.txt").write_text("stale")
+        transcripts = [make_transcript("video1")]
 
-            create_volumes(
-                transcripts=transcripts,
-                output_dir=output_dir,
-                channel_name="TestChannel",
-            )
+        create_volumes(
+            transcripts=transcripts,
+            output_dir=tmp_path,
+            channel_name="TestChannel",
+        )
 
-            assert not (output_dir / "TestChannel_Vol99.txt").exists()
-            assert (output_dir / "TestChannel_Vol01.txt").exists()
+        assert not (tmp_path / "TestChannel_Vol99.txt").exists()
+        assert (tmp_path / "TestChannel_Vol01.txt").exists()
 
 
 class TestWriteManifest:
     """Tests for manifest writing."""
 
-    def test_writes_manifest_json(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def manifest(tmp_path_factory):
+        """One shared manifest write for the read-only assertions."""
+        output_dir = tmp_path_factory.mktemp("manifest")
+        stats = {'total': 10, 'volumes': ['Vol01.txt', 'Vol02.txt'], 'skipped': []}
+        manifest_path = write_manifest(output_dir, "TestChannel", stats)
+        with manifest_path.open('rb') as f:
+            return {'path': manifest_path, 'data': json.load(f)}
+
+    def test_writes_manifest_json(self, manifest):
         """Should write valid JSON manifest."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            stats = {'total': 10, 'volumes': ['Vol01.txt', 'Vol02.txt'], 'skipped': []}
+        assert manifest['path'].exists()
+        data = manifest['data']
+        assert data['channel'] == "TestChannel"
+        assert data['total_transcripts'] == 10
+        assert len(data['volumes']) == 2
 
-            manifest_path = write_manifest(output_dir, "TestChannel", stats)
-
-            assert manifest_path.exists()
-            data = json.loads(manifest_path.read_text())
-            assert data['channel'] == "TestChannel"
-            assert data['total_transcripts'] == 10
-            assert len(data['volumes']) == 2
-
-    def test_manifest_has_timestamp(self):
+    def test_manifest_has_timestamp(self, manifest):
         """Should include generation timestamp."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            stats = {'total': 5, 'volumes': ['Vol01.txt'], 'skipped': []}
-
-            manifest_path = write_manifest(output_dir, "TestChannel", stats)
-
-            data = json.loads(manifest_path.read_text())
-            assert 'generated_at' in data
+        assert 'generated_at' in manifest['data']
 
 
 class TestCreateCleanTranscriptFiles:
     """Tests for writing per-video clean transcript files."""
 
-    def test_writes_clean_transcripts_to_dedicated_folder(self):
+    def test_writes_clean_transcripts_to_dedicated_folder(self, tmp_path):
         """Should create one clean markdown file per transcript."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            transcripts = [make_transcript("20240101_First Video")]
+        transcripts = [make_transcript("20240101_First Video")]
 
-            files = create_clean_transcript_files(transcripts, output_dir)
+        files = create_clean_transcript_files(transcripts, tmp_path)
 
-            assert files == ["20240101_First Video.md"]
-            content = (output_dir / "20240101_First Video.md").read_text()
-            assert "## 2024-01-01 · First Video" in content
-            assert "Test content" in content
+        assert files == ["20240101_First Video.md"]
+        content = (tmp_path / "20240101_First Video.md").read_text()
+        assert "## 2024-01-01 · First Video" in content
+        assert "Test content" in content
 
-    def test_removes_stale_clean_transcripts_before_writing(self):
+    def test_removes_stale_clean_transcripts_before_writing(self, tmp_path):
         """Should not leave old clean transcript files from a previous export."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            (output_dir / "stale.md").write_text("stale")
-            transcripts = [make_transcript("20240101_First Video")]
+        (tmp_path / "stale.md").write_text("stale")
+        transcripts = [make_transcript("20240101_First Video")]
 
-            create_clean_transcript_files(transcripts, output_dir)
+        create_clean_transcript_files(transcripts, tmp_path)
 
-            assert not (output_dir / "stale.md").exists()
-            assert (output_dir / "20240101_First Video.md").exists()
+        assert not (tmp_path / "stale.md").exists()
+        assert (tmp_path / "20240101_First Video.md").exists()
@@ -1,6 +1,8 @@
 # tests/test_downloader.py
 """Tests for YouTube downloader module."""
 
+from types import SimpleNamespace
+
 import pytest
 from ytrag.downloader import (
     Downloader,
@@ -13,20 +15,30 @@ from ytrag.downloader import (
 class TestGetYdlOptions:
     """Tests for yt-dlp options configuration."""
 
-    def test_skip_download_is_true(self):
-        """Should set skip_download to True."""
-        opts = get_ydl_options("/tmp", "/tmp/archive.txt")
-        assert opts['skip_download'] is True
-
-    def test_writes_subtitles(self):
-        """Should enable subtitle writing."""
-        opts = get_ydl_options("/tmp", "/tmp/archive.txt")
-        assert opts['writesubtitles'] is True
-        assert opts['writeautomaticsub'] is True
-
-    def test_sets_subtitle_languages(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def opts():
+        """One default option dict shared by all read-only assertions."""
+        return get_ydl_options("/tmp", "/tmp/archive.txt")
+
+    @pytest.mark.parametrize("key,expected", [
+        ('skip_download', True),
+        ('writesubtitles', True),
+        ('writeautomaticsub', True),
+        ('download_archive', "/tmp/archive.txt"),
+        ('sleep_interval_requests', 0.75),
+        ('sleep_interval', 10),
+        ('max_sleep_interval', 20),
+        ('sleep_interval_subtitles', 5),
+        ('skip_playlist_after_errors', 3),
+        ('extractor_retries', 6),
+    ])
+    def test_default_option(self, opts, key, expected):
+        """Should use subtitle-only, rate-limit-friendly defaults."""
+        assert opts[key] == expected
+
+    def test_sets_subtitle_languages(self, opts):
         """Should set default subtitle language to English."""
-        opts = get_ydl_options("/tmp", "/tmp/archive.txt")
         assert 'en' in opts['subtitleslangs']
 
     def test_accepts_custom_languages(self):
@@ -35,34 +47,14 @@ class TestGetYdlOptions:
         assert 'fr' in opts['subtitleslangs']
         assert 'de' in opts['subtitleslangs']
 
-    def test_sets_archive_path(self):
-        """Should set download archive path."""
-        opts = get_ydl_options("/tmp", "/tmp/archive.txt")
-        assert opts['download_archive'] == "/tmp/archive.txt"
-
     def test_sets_output_template(self):
         """Should set output template with date."""
         opts = get_ydl_options("/output", "/tmp/archive.txt")
         assert '%(upload_date)s' in opts['outtmpl']
         assert '%(title)s' in opts['outtmpl']
 
-    def test_uses_yt_dlp_sleep_preset_defaults(self):
-        """Should use conservative sleep defaults for large YouTube channels."""
-        opts = get_ydl_options("/tmp", "/tmp/archive.txt")
-        assert opts['sleep_interval_requests'] == 0.75
-        assert opts['sleep_interval'] == 10
-        assert opts['max_sleep_interval'] == 20
-        assert opts['sleep_interval_subtitles'] == 5
-
-    def test_stops_playlist_after_consecutive_errors_by_default(self):
-        """Should stop a playlist after repeated failures."""
-        opts = get_ydl_options("/tmp", "/tmp/archive.txt")
-        assert opts['skip_playlist_after_errors'] == 3
-
-    def test_retries_extractor_with_long_backoff(self):
+    def test_retries_extractor_with_long_backoff(self, opts):
         """Should pause between extractor retries so rate limits can reset."""
-        opts = get_ydl_options("/tmp", "/tmp/archive.txt")
-        assert opts['extractor_retries'] == 6
         sleep = opts['retry_sleep_functions']['extractor']
         assert sleep(0) == 300
         assert sleep(1) == 600
@@ -166,7 +158,7 @@ class TestDownloaderChannelUrls:
                     'entries': [{'id': 'a'}],
                 }
 
-        monkeypatch.setattr('ytrag.downloader.yt_dlp.YoutubeDL', FakeYoutubeDL)
+        monkeypatch.setattr('ytrag.downloader.yt_dlp', SimpleNamespace(YoutubeDL=FakeYoutubeDL))
 
         info = Downloader(tmp_path).get_channel_info("https://www.youtube.com/@channel")
 
@@ -190,7 +182,7 @@ class TestDownloaderChannelUrls:
             def download(self, urls):
                 calls.extend(urls)
 
-        monkeypatch.setattr('ytrag.downloader.yt_dlp.YoutubeDL', FakeYoutubeDL)
+        monkeypatch.setattr('ytrag.downloader.yt_dlp', SimpleNamespace(YoutubeDL=FakeYoutubeDL))
         downloader = Downloader(tmp_path)
         monkeypatch.setattr(downloader.rate_limiter, 'wait', lambda: None)
 
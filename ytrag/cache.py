@@ -0,0 +1,53 @@
+# ytrag/cache.py
+"""Small TTL cache for channel metadata.
+
+Channel info rarely changes between runs, but fetching it hits YouTube
+and is rate-limit-exposed. This keeps the last responses in one JSON
+file under the user's cache directory — no extra dependency needed for
+a handful of entries.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_TTL = 86400  # one day
+_CACHE_NAME = "channel_info.json"
+
+
+def _cache_file() -> Path:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    return Path(base) / 'ytrag' / _CACHE_NAME
+
+
+def _load() -> dict:
+    try:
+        with _cache_file().open('rb') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get(key: str) -> Optional[dict]:
+    """Return the cached value for `key`, or None if missing or expired."""
+    entry = _load().get(key)
+    if entry and entry.get('expires', 0) > time.time():
+        return entry.get('value')
+    return None
+
+
+def set(key: str, value: dict, ttl: int = DEFAULT_TTL) -> None:
+    """Store `value` under `key` for `ttl` seconds. Failures are ignored."""
+    now = time.time()
+    data = {k: v for k, v in _load().items() if v.get('expires', 0) > now}
+    data[key] = {'expires': now + ttl, 'value': value}
+    path = _cache_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(json.dumps(data).encode('utf-8'))
+    except OSError:
+        pass
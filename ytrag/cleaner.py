@@ -1,30 +1,56 @@
 """VTT cleaner module for converting subtitles to clean, readable text."""
 
+import os
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 
 from ytrag.utils import (
     extract_base_name,
-    is_regional_variant,
     get_language_from_filename,
 )
 
+# Below this many files the pool startup costs more than it saves
+PARALLEL_THRESHOLD = 8
+
 # Useless markers to filter (case-insensitive)
-USELESS_MARKERS = {
+USELESS_MARKERS = frozenset({
     '[music]', '[applause]', '[laughter]', '[cheering]', '[silence]',
     '[inaudible]', '[crosstalk]', '[noise]', '[background noise]',
     '[foreign]', '[speaking foreign language]', '[no audio]',
     '[pause]', '[sighs]', '[coughs]', '[clears throat]',
-}
+})
 
 # Precompiled regex patterns for performance
-RE_TIMESTAMP_LINE = re.compile(r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})')
-RE_HTML_TAGS = re.compile(r'<[^>]+>')
-RE_POSITION_ATTRS = re.compile(r'align:\w+|position:\d+%')
-RE_INLINE_TIMESTAMP = re.compile(r'<\d{2}:\d{2}:\d{2}\.\d{3}>')
+# One whole-buffer cue matcher: captures both timestamps — already split
+# into their h/m/s/ms components — plus the cue's text lines (up to the
+# next blank line or timestamp), so the parser iterates cues in C instead
+# of dispatching on every line in Python
+RE_CUE = re.compile(
+    r'(\d{2}):(\d{2}):(\d{2})\.(\d{3})\s*-->\s*'
+    r'(\d{2}):(\d{2}):(\d{2})\.(\d{3})[^\n]*\n'
+    r'((?:(?!\d{2}:\d{2}:\d{2}\.\d{3}).+\n?)*)',
+    re.MULTILINE,
+)
+# Tags, inline timestamps (<00:00:01.000>) and cue positioning attributes in
+# one alternation, so each line is scanned once instead of three times
+RE_VTT_NOISE = re.compile(r'<[^>]*>|align:\w+|position:\d+%')
 RE_MULTIPLE_SPACES = re.compile(r'\s+')
+RE_SENTENCE_BOUNDARY = re.compile(r'([.?!]\W*)(\w)', re.S)
+RE_USELESS_MARKERS = re.compile(
+    r'\[(?:' + '|'.join(re.escape(marker.strip('[]')) for marker in sorted(USELESS_MARKERS)) + r')\]',
+    re.IGNORECASE,
+)
+RE_HTML_ENTITIES = re.compile(r'&(?:nbsp|amp|#39|quot);')
+HTML_ENTITIES = {
+    '&nbsp;': ' ',
+    '&amp;': '&',
+    '&#39;': "'",
+    '&quot;': '"',
+}
 
 
 def normalize_language(language: str) -> str:
@@ -41,6 +67,15 @@ def parse_vtt_timestamp(timestamp: str) -> Optional[float]:
     """Convert VTT timestamp (HH:MM:SS.mmm) to seconds."""
     if not timestamp:
         return None
+    # Fast path: cue timestamps are strictly HH:MM:SS.mmm (12 chars), so
+    # parse by fixed offsets without the split() list and float parsing
+    if (len(timestamp) == 12 and timestamp[2] == ':'
+            and timestamp[5] == ':' and timestamp[8] == '.'):
+        try:
+            return (int(timestamp[0:2]) * 3600 + int(timestamp[3:5]) * 60 +
+                    int(timestamp[6:8]) + int(timestamp[9:12]) * 0.001)
+        except ValueError:
+            return None
     try:
         parts = timestamp.split(':')
         if len(parts) != 3:
@@ -59,23 +94,13 @@ def capitalize_sentences(text: str) -> str:
         return text
 
     # Capitalize start
-    text = text[0].upper() + text[1:] if len(text) > 1 else text.upper()
+    text = text[:1].upper() + text[1:]
 
-    # Capitalize after sentence-ending punctuation
-    result = []
-    capitalize_next = False
-
-    for i, char in enumerate(text):
-        if capitalize_next and char.isalpha():
-            result.append(char.upper())
-            capitalize_next = False
-        else:
-            result.append(char)
-
-        if char in '.?!' and i < len(text) - 1:
-            capitalize_next = True
-
-    return ''.join(result)
+    # Capitalize after sentence-ending punctuation in one regex pass
+    # instead of walking the text character by character in Python
+    return RE_SENTENCE_BOUNDARY.sub(
+        lambda m: m.group(1) + m.group(2).upper(), text
+    )
 
 
 def clean_vtt_content(content: str, pause_threshold: float = 2.5) -> str:
@@ -87,113 +112,106 @@ def clean_vtt_content(content: str, pause_threshold: float = 2.5) -> str:
     if not content:
         return ""
 
-    # First pass: extract blocks with timestamps
-    blocks = []
-    current_end_time: Optional[float] = None
+    # Single pass: cue lines are folded straight into paragraphs, so no
+    # intermediate block structures survive the loop
+    paragraphs: list[str] = []
+
+    def flush_paragraph() -> None:
+        # Lines are whitespace-normalized on admission, so joining with a
+        # single space needs no rescan. Capitalizing here keeps the regex
+        # working on one small paragraph at a time
+        paragraph = ' '.join(current_block_text)
+        if paragraph:
+            paragraphs.append(capitalize_sentences(paragraph))
+        current_block_text.clear()
+
+    pause_threshold_ms = int(pause_threshold * 1000)
+    current_end_ms: Optional[int] = None
     current_block_text: list[str] = []
-    seen_lines: set[str] = set()
-
-    lines = content.splitlines()
-    i = 0
-
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Skip metadata lines
-        if (not line or
-            line == "WEBVTT" or
-            line.startswith("Kind:") or
-            line.startswith("Language:") or
-            line.isdigit()):
-            i += 1
-            continue
-
-        # Detect timestamp line
-        match_time = RE_TIMESTAMP_LINE.search(line)
-        if match_time:
-            start_time = parse_vtt_timestamp(match_time.group(1))
-            end_time = parse_vtt_timestamp(match_time.group(2))
-
-            # Check for significant pause (new paragraph)
-            if current_end_time is not None and start_time is not None:
-                pause = start_time - current_end_time
-                if pause >= pause_threshold and current_block_text:
-                    blocks.append({
-                        'text': current_block_text.copy(),
-                        'is_new_paragraph': True
-                    })
-                    current_block_text = []
-                    seen_lines = set()
-
-            current_end_time = end_time
-            i += 1
-            continue
-
-        # Process text line
-        line = RE_POSITION_ATTRS.sub('', line).strip()
-        line = RE_INLINE_TIMESTAMP.sub('', line)
-        plain_text = RE_HTML_TAGS.sub('', line)
-
-        # Replace HTML entities
-        plain_text = (plain_text
-            .replace('&nbsp;', ' ')
-            .replace('&amp;', '&')
-            .replace('&#39;', "'")
-            .replace('&quot;', '"')
-            .replace('  ', ' ')
-            .strip())
-
-        # Filter useless markers
-        if plain_text.lower() in USELESS_MARKERS:
-            i += 1
-            continue
-
-        # Also filter if contains only a marker
-        text_without_marker = plain_text
-        for marker in USELESS_MARKERS:
-            text_without_marker = text_without_marker.lower().replace(marker, '').strip()
-        if not text_without_marker:
-            i += 1
-            continue
-
-        # Deduplicate
-        if plain_text and plain_text not in seen_lines:
-            current_block_text.append(plain_text)
-            seen_lines.add(plain_text)
-
-        i += 1
-
-    # Add last block
+    # YouTube's rolling captions repeat the previous cue's text verbatim
+    # or as the tail of the new cue, so remembering just the last admitted
+    # line deduplicates them without hashing every line into a window
+    last_line = ''
+
+    # Iterating cue matches skips the WEBVTT header, Kind:/Language:
+    # metadata and cue numbers for free — they never match RE_CUE
+    for cue in RE_CUE.finditer(content):
+        # The regex already split both timestamps into components, so the
+        # millisecond values are a multiply-add away — no re-parsing
+        groups = cue.groups()
+        start_ms = ((int(groups[0]) * 3600 + int(groups[1]) * 60 +
+                     int(groups[2])) * 1000 + int(groups[3]))
+
+        # Check for significant pause (new paragraph)
+        if current_end_ms is not None:
+            if start_ms - current_end_ms >= pause_threshold_ms and current_block_text:
+                flush_paragraph()
+                last_line = ''
+
+        current_end_ms = ((int(groups[4]) * 3600 + int(groups[5]) * 60 +
+                           int(groups[6])) * 1000 + int(groups[7]))
+
+        for line in groups[8].splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            # Most caption lines carry no markup at all, and a substring
+            # check is far cheaper than entering the regex engine
+            plain_text = line
+            if '<' in line or 'align:' in line or 'position:' in line:
+                plain_text = RE_VTT_NOISE.sub('', plain_text)
+            if '&' in plain_text:
+                plain_text = RE_HTML_ENTITIES.sub(
+                    lambda m: HTML_ENTITIES[m.group(0)], plain_text
+                )
+
+            # Collapse whitespace here, on the short line, so the joined
+            # paragraph never needs a second normalization pass
+            plain_text = RE_MULTIPLE_SPACES.sub(' ', plain_text).strip()
+
+            # Filter lines that contain nothing but useless markers: a set
+            # lookup catches the common single-marker line, and one
+            # alternation pass handles combinations of markers
+            if plain_text and (
+                    plain_text.lower() in USELESS_MARKERS or
+                    not RE_USELESS_MARKERS.sub('', plain_text).strip()):
+                continue
+
+            # Deduplicate exact repeats and rolling-caption tails
+            if (plain_text and plain_text != last_line
+                    and not last_line.endswith(plain_text)):
+                current_block_text.append(plain_text)
+                last_line = plain_text
+
+    # Flush the last paragraph
     if current_block_text:
-        blocks.append({
-            'text': current_block_text,
-            'is_new_paragraph': False
-        })
-
-    # Second pass: join lines into paragraphs
-    paragraphs = []
-
-    for block in blocks:
-        if not block['text']:
-            continue
-        paragraph = ' '.join(block['text'])
-        paragraph = RE_MULTIPLE_SPACES.sub(' ', paragraph).strip()
-        if paragraph:
-            paragraphs.append(paragraph)
+        flush_paragraph()
 
-    # Join paragraphs with double newline
-    final_text = '\n\n'.join(paragraphs)
+    # Join paragraphs with double newline; each one is already capitalized
+    return '\n\n'.join(paragraphs)
 
-    # Capitalize sentences
-    final_text = capitalize_sentences(final_text)
 
-    return final_text
+def _read_vtt(vtt_path: Path) -> str:
+    """Read a VTT file; split out so reads can be prefetched on a thread.
+
+    read_bytes + bytes.decode uses the C UTF-8 decoder in one shot, where
+    read_text goes through a TextIOWrapper's incremental decoder.
+    """
+    return vtt_path.read_bytes().decode('utf-8', 'ignore')
 
 
-def process_vtt_file(vtt_path: Path, channel_name: str) -> Optional[dict]:
+def process_vtt_file(
+    vtt_path: Path,
+    channel_name: str,
+    content: Optional[str] = None,
+) -> Optional[dict]:
     """
     Process a single VTT file and return cleaned content.
 
+    Pass `content` to skip the read when the file was already loaded
+    (e.g. by a prefetching caller).
+
     Returns:
         Dict with keys: base_name, language, content, source_file
         Or None if processing failed or content is empty.
@@ -203,7 +221,8 @@ def process_vtt_file(vtt_path: Path, channel_name: str) -> Optional[dict]:
         base_name = extract_base_name(filename)
         language = get_language_from_filename(filename)
 
-        content = vtt_path.read_text(encoding='utf-8', errors='ignore')
+        if content is None:
+            content = _read_vtt(vtt_path)
         cleaned = clean_vtt_content(content)
 
         if not cleaned.strip():
@@ -262,34 +281,99 @@ def process_vtt_directory(
     Returns list of processed transcript dicts, sorted by base_name.
     Handles deduplication (prefers non-regional variants).
     """
-    vtt_files = list(temp_dir.glob('*.vtt'))
+    # os.scandir is a single readdir pass; glob('*.vtt') adds fnmatch
+    # pattern compilation and a stat per entry on top of that
+    with os.scandir(temp_dir) as entries:
+        vtt_files = [Path(entry.path) for entry in entries
+                     if entry.name.endswith('.vtt') and entry.is_file()]
+    # Classify each filename's language exactly once; the majority vote
+    # and the priority sort both read from this dict instead of rerunning
+    # the suffix regex per use
+    languages = {vtt_file.name: get_language_from_filename(vtt_file.name)
+                 for vtt_file in vtt_files}
     preferred_language = choose_preferred_language(
-        [get_language_from_filename(vtt_file.name) for vtt_file in vtt_files],
-        preferred_langs,
+        list(languages.values()), preferred_langs,
     )
 
-    def sort_key(f: Path) -> tuple[int, str]:
-        language = get_language_from_filename(f.name)
-        return (*language_priority(language, preferred_language), f.name)
+    # Sorting by base_name first means results come out in final order as
+    # the list is scanned — no re-sort afterwards; the language priority
+    # still decides which candidate wins within each base
+    def sort_key(f: Path) -> tuple[str, int, int, str, str]:
+        return (extract_base_name(f.name),
+                *language_priority(languages[f.name], preferred_language),
+                f.name)
 
     vtt_files.sort(key=sort_key)
 
     processed_bases: set[str] = set()
     results: list[dict] = []
 
-    for vtt_file in vtt_files:
-        base_name = extract_base_name(vtt_file.name)
-
-        # Skip if already processed (deduplication)
-        if base_name in processed_bases:
-            continue
-
-        result = process_vtt_file(vtt_file, channel_name)
-        if result:
-            results.append(result)
-            processed_bases.add(base_name)
-
-    # Sort by base_name (which typically starts with date)
-    results.sort(key=lambda x: x['base_name'])
+    if len(vtt_files) < PARALLEL_THRESHOLD:
+        # Prefetch reads on a thread so the next file's I/O overlaps with
+        # the regex cleaning of the current one
+        with ThreadPoolExecutor(max_workers=2) as reader:
+            reads = {vtt_file: reader.submit(_read_vtt, vtt_file)
+                     for vtt_file in vtt_files}
+            for vtt_file in vtt_files:
+                base_name = extract_base_name(vtt_file.name)
+
+                # Skip if already processed (deduplication)
+                if base_name in processed_bases:
+                    continue
+
+                try:
+                    content = reads[vtt_file].result()
+                except OSError:
+                    continue
+                result = process_vtt_file(vtt_file, channel_name, content=content)
+                if result:
+                    results.append(result)
+                    processed_bases.add(base_name)
+    else:
+        # Deduplicate by base_name up front so lower-priority language
+        # variants are never cleaned at all; the sorted order makes the
+        # first candidate per base the preferred one
+        primary: list[tuple[str, Path]] = []
+        alternates: dict[str, list[Path]] = {}
+        for vtt_file in vtt_files:
+            base_name = extract_base_name(vtt_file.name)
+            if base_name not in alternates:
+                alternates[base_name] = []
+                primary.append((base_name, vtt_file))
+            else:
+                alternates[base_name].append(vtt_file)
+
+        # Cleaning is CPU-bound regex work and each file is independent,
+        # so fan the preferred candidates out across processes
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            cleaned = pool.map(
+                process_vtt_file,
+                [vtt_file for _, vtt_file in primary],
+                repeat(channel_name),
+                chunksize=8,
+            )
+            for (base_name, _), result in zip(primary, cleaned):
+                if result:
+                    results.append(result)
+                    processed_bases.add(base_name)
+
+        # Rare: a preferred file cleaned to nothing — fall back to its
+        # skipped variants serially, matching the serial path's behavior
+        fallback_used = False
+        for base_name, candidates in alternates.items():
+            if base_name in processed_bases:
+                continue
+            for vtt_file in candidates:
+                result = process_vtt_file(vtt_file, channel_name)
+                if result:
+                    results.append(result)
+                    processed_bases.add(base_name)
+                    fallback_used = True
+                    break
+
+        # Fallback entries were appended out of order; everything else
+        # already came out sorted by base_name
+        if fallback_used:
+            results.sort(key=lambda x: x['base_name'])
 
     return results
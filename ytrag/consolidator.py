@@ -2,8 +2,8 @@
 """Consolidate transcripts into LLM-ready volumes."""
 
 import json
-import math
 import re
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 
@@ -25,7 +25,9 @@ def calculate_transcripts_per_volume(
         return max(1, per_volume)
     if total_transcripts <= 0:
         return TRANSCRIPTS_PER_VOLUME
-    return max(1, math.ceil(total_transcripts / max(1, target_volumes)))
+    volumes = max(1, target_volumes)
+    # Integer ceiling division: no float round-trip
+    return max(1, -(-total_transcripts // volumes))
 
 
 def extract_video_metadata(base_name: str) -> dict:
@@ -44,14 +46,11 @@ def format_transcript(transcript: dict, source_marker_frequency: int = 3) -> str
     metadata = extract_video_metadata(transcript['base_name'])
     source_marker = f"[Fuente: {metadata['label']}]"
     paragraphs = [p.strip() for p in transcript['content'].split('\n\n') if p.strip()]
-    body_parts = []
     frequency = max(1, source_marker_frequency)
-
-    for index, paragraph in enumerate(paragraphs):
-        if index % frequency == 0:
-            body_parts.append(f"{source_marker}\n{paragraph}")
-        else:
-            body_parts.append(paragraph)
+    body_parts = [
+        f"{source_marker}\n{paragraph}" if index % frequency == 0 else paragraph
+        for index, paragraph in enumerate(paragraphs)
+    ]
 
     lines = [
         f"## {metadata['label']}",
@@ -93,47 +92,50 @@ def create_volumes(
         stale_volume.unlink()
 
     total_transcripts = len(transcripts)
-    total_volumes = math.ceil(total_transcripts / transcripts_per_volume)
+    total_volumes = -(-total_transcripts // transcripts_per_volume)
 
     volumes = []
+    remaining = iter(transcripts)
 
     for vol_num in range(total_volumes):
         start = vol_num * transcripts_per_volume
-        end = start + transcripts_per_volume
-        batch = transcripts[start:end]
+        # islice walks the shared iterator, so no slice copy per volume
+        batch = list(islice(remaining, transcripts_per_volume))
 
         volume_name = f"{channel_name}_Vol{vol_num + 1:02d}.txt"
         volume_path = output_dir / volume_name
 
-        content_parts = []
         index_entries = []
 
-        # Volume header
-        content_parts.append(f"=== COLECCIÓN: {channel_name} ===\n")
-        content_parts.append(f"=== VOLUMEN: {vol_num + 1} de {total_volumes} ===\n")
-        content_parts.append(f"=== CONTENIDO: Transcripciones {start + 1} a {start + len(batch)} ===\n\n")
-
-        for idx, transcript in enumerate(batch):
-            # Format and add transcript
-            formatted = format_transcript(transcript, source_marker_frequency=source_marker_frequency)
-            content_parts.append(formatted)
-
-            # Add to index
-            index_entries.append(f"{start + idx + 1}. {transcript['base_name']}")
-
-            # Add separator between transcripts (not after last one)
-            if idx < len(batch) - 1:
-                content_parts.append(SEPARATOR)
-
-        # Add index at the end
-        if index_entries:
-            content_parts.append("\n\n" + "=" * 60 + "\n")
-            content_parts.append("=== ÍNDICE DE ESTE VOLUMEN ===\n")
-            content_parts.append("=" * 60 + "\n\n")
-            content_parts.append("\n".join(index_entries))
-            content_parts.append("\n")
+        # Stream each formatted transcript straight to disk so only one
+        # transcript is in memory at a time, not the whole volume; the
+        # large buffer keeps the actual writes big and sequential
+        with volume_path.open('wb', buffering=1 << 20) as out:
+            # Volume header
+            out.write(f"=== COLECCIÓN: {channel_name} ===\n".encode('utf-8'))
+            out.write(f"=== VOLUMEN: {vol_num + 1} de {total_volumes} ===\n".encode('utf-8'))
+            out.write(f"=== CONTENIDO: Transcripciones {start + 1} a {start + len(batch)} ===\n\n".encode('utf-8'))
+
+            for idx, transcript in enumerate(batch):
+                # Separator goes before every entry but the first, which
+                # drops the per-iteration length comparison
+                if idx:
+                    out.write(SEPARATOR.encode('utf-8'))
+
+                formatted = format_transcript(transcript, source_marker_frequency=source_marker_frequency)
+                out.write(formatted.encode('utf-8'))
+
+                # Add to index
+                index_entries.append(f"{start + idx + 1}. {transcript['base_name']}")
+
+            # Add index at the end
+            if index_entries:
+                out.write(("\n\n" + "=" * 60 + "\n").encode('utf-8'))
+                out.write("=== ÍNDICE DE ESTE VOLUMEN ===\n".encode('utf-8'))
+                out.write(("=" * 60 + "\n\n").encode('utf-8'))
+                out.write("\n".join(index_entries).encode('utf-8'))
+                out.write(b"\n")
 
-        volume_path.write_text("".join(content_parts), encoding='utf-8')
         volumes.append(volume_name)
 
     return {
@@ -157,9 +159,10 @@ def create_clean_transcript_files(
     for transcript in transcripts:
         filename = f"{sanitize_filename(transcript['base_name'])}.md"
         path = output_dir / filename
-        path.write_text(
-            format_transcript(transcript, source_marker_frequency=source_marker_frequency),
-            encoding='utf-8',
+        path.write_bytes(
+            format_transcript(
+                transcript, source_marker_frequency=source_marker_frequency
+            ).encode('utf-8')
         )
         files.append(filename)
 
@@ -6,11 +6,23 @@ import tempfile
 from pathlib import Path
 from typing import Optional, Callable
 from urllib.parse import urlparse, urlunparse
-import yt_dlp
 
 from ytrag.rate_limiter import AdaptiveRateLimiter
 from ytrag.utils import ARCHIVE_FILE, ensure_dir, is_valid_youtube_url
 
+# Imported lazily: yt-dlp pulls in a large dependency tree (~hundreds of ms)
+# that option-building helpers and the test suite never need.
+yt_dlp = None
+
+
+def _load_yt_dlp():
+    """Import yt_dlp on first use and cache it at module level."""
+    global yt_dlp
+    if yt_dlp is None:
+        import yt_dlp as module
+        yt_dlp = module
+    return yt_dlp
+
 
 CHANNEL_TABS = {'videos', 'shorts', 'streams', 'live', 'playlists', 'community', 'featured'}
 RATE_LIMIT_MARKERS = (
@@ -143,6 +155,7 @@ class Downloader:
         if not is_valid_youtube_url(url):
             raise ValueError(f"Invalid YouTube URL: {url}")
 
+        _load_yt_dlp()
         download_url = normalize_youtube_collection_url(url)
         opts = {
             'quiet': True,
@@ -191,6 +204,7 @@ class Downloader:
         if not is_valid_youtube_url(url):
             raise ValueError(f"Invalid YouTube URL: {url}")
 
+        _load_yt_dlp()
         download_url = normalize_youtube_collection_url(url)
 
         # Create temp directory for downloads
@@ -1,35 +1,53 @@
 # ytrag/main.py
 """ytrag CLI - YouTube transcripts to RAG-ready volumes."""
 
+import json
+import os
+import re
 import shutil
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn, TimeRemainingColumn
 from rich.panel import Panel
 
 from ytrag import __version__
-from ytrag.downloader import Downloader
-from ytrag.cleaner import process_vtt_directory
-from ytrag.consolidator import (
-    calculate_transcripts_per_volume,
-    create_clean_transcript_files,
-    create_volumes,
-    write_manifest,
-)
 from ytrag.utils import ARCHIVE_FILE, ensure_dir, sanitize_filename
 
+# The pipeline modules (downloader, cleaner, consolidator, rich progress)
+# are imported inside the commands that need them, so --version, --help
+# and shell completion do not pay their import cost
+
 app = typer.Typer(
     name="ytrag",
     help="YouTube transcripts -> RAG-ready volumes",
     add_completion=False,
 )
 console = Console()
+
+
+def spinner_status(message: str):
+    """console.status, but a no-op when output is piped.
+
+    Rich's status spins up a live-render thread that batch scripts with
+    redirected output pay for without seeing anything.
+    """
+    if sys.stdout.isatty():
+        return console.status(message)
+    return nullcontext()
+
+
 TARGET_VOLUMES = 50
 SOURCE_MARKER_FREQUENCY = 3
+LANG_SPLIT_RE = re.compile(r'\s*,\s*')
+
+
+def split_langs(value: str) -> list[str]:
+    """Split a comma-separated language list, dropping empty tokens."""
+    return [token for token in LANG_SPLIT_RE.split(value.strip()) if token]
 
 
 def build_output_paths(output: Path, channel_name: str) -> dict[str, Path]:
@@ -121,8 +139,21 @@ def all_pipeline(
     stop_after_errors: int = typer.Option(3, "--stop-after-errors", help="Stop playlist after this many consecutive failures"),
     rate_limit_retries: int = typer.Option(6, "--rate-limit-retries", help="Extractor retries when YouTube rate-limits the session"),
     rate_limit_retry_sleep: float = typer.Option(300, "--rate-limit-retry-sleep", help="Base seconds for exponential rate-limit retry backoff"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the cached channel metadata"),
 ):
     """Download YouTube transcripts and create RAG-ready volumes."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn, TimeRemainingColumn
+
+    from ytrag import cache as channel_cache
+    from ytrag.cleaner import process_vtt_directory
+    from ytrag.consolidator import (
+        calculate_transcripts_per_volume,
+        create_clean_transcript_files,
+        create_volumes,
+        write_manifest,
+    )
+    from ytrag.downloader import Downloader
+
     output = Path(output).resolve()
 
     console.print(Panel.fit(
@@ -132,20 +163,25 @@ def all_pipeline(
 
     downloader = Downloader(output_dir=output)
 
-    # Get channel info
-    with console.status("[bold green]Connecting to YouTube..."):
-        try:
-            info = downloader.get_channel_info(url)
-        except Exception as e:
-            console.print(f"[red]Error:[/] Could not fetch info: {e}")
-            raise typer.Exit(1)
+    # Get channel info; cached so repeated runs on the same channel skip
+    # the metadata round-trip (and its rate-limit exposure) entirely
+    info = None if no_cache else channel_cache.get(url)
+    if info is None:
+        with spinner_status("[bold green]Connecting to YouTube..."):
+            try:
+                info = downloader.get_channel_info(url)
+            except Exception as e:
+                console.print(f"[red]Error:[/] Could not fetch info: {e}")
+                raise typer.Exit(1)
+        if not no_cache:
+            channel_cache.set(url, info)
 
     channel_name = info['channel']
 
     # Determine languages
     prompt = should_prompt(interactive)
     if lang:
-        langs = [l.strip() for l in lang.split(",")]
+        langs = split_langs(lang)
     elif prompt:
         default_lang = info.get('default_language') or 'es'
         language_answer = typer.prompt(
@@ -153,7 +189,7 @@ def all_pipeline(
             default=default_lang,
             show_default=True,
         )
-        langs = [l.strip() for l in language_answer.split(",") if l.strip()]
+        langs = split_langs(language_answer)
     else:
         default_lang = info.get('default_language') or 'en'
         langs = [default_lang]
@@ -201,11 +237,20 @@ def all_pipeline(
         TextColumn("ETA:"),
         TimeRemainingColumn(),
         console=console,
+        disable=not sys.stdout.isatty(),
     ) as progress:
         task = progress.add_task("Downloading subtitles...", total=progress_total)
+        last_state: list = [None]
 
         def progress_hook(data: dict) -> None:
-            current, total = extract_download_progress(data, fallback_total=progress_total)
+            # yt-dlp fires this per downloaded chunk; only poke Rich when
+            # the playlist position actually moved, so its render path is
+            # not re-entered thousands of times per video
+            state = extract_download_progress(data, fallback_total=progress_total)
+            if state == last_state[0]:
+                return
+            last_state[0] = state
+            current, total = state
             update = {}
             if total is not None:
                 update['total'] = total
@@ -248,7 +293,7 @@ def all_pipeline(
                 shutil.copy2(vtt_file, raw_dir / vtt_file.name)
 
         # Process VTT files
-        with console.status("[bold green]Processing transcripts..."):
+        with spinner_status("[bold green]Processing transcripts..."):
             transcripts = process_vtt_directory(temp_dir, channel_name, preferred_langs=langs)
 
         if not transcripts:
@@ -262,7 +307,7 @@ def all_pipeline(
             per_volume=per_volume,
         )
 
-        with console.status("[bold green]Writing clean transcripts..."):
+        with spinner_status("[bold green]Writing clean transcripts..."):
             clean_files = create_clean_transcript_files(
                 transcripts,
                 clean_dir,
@@ -270,7 +315,7 @@ def all_pipeline(
             )
 
         # Create volumes
-        with console.status("[bold green]Creating volumes..."):
+        with spinner_status("[bold green]Creating volumes..."):
             stats = create_volumes(
                 transcripts=transcripts,
                 output_dir=volumes_dir,
@@ -304,6 +349,14 @@ def rebuild(
     interactive: Optional[bool] = typer.Option(None, "--interactive/--no-interactive", help="Ask export questions in an interactive terminal"),
 ):
     """Rebuild clean transcripts and RAG-ready volumes from local VTT files."""
+    from ytrag.cleaner import process_vtt_directory
+    from ytrag.consolidator import (
+        calculate_transcripts_per_volume,
+        create_clean_transcript_files,
+        create_volumes,
+        write_manifest,
+    )
+
     source = Path(source).resolve()
     output = Path(output).resolve()
 
@@ -323,14 +376,14 @@ def rebuild(
 
     prompt = should_prompt(interactive)
     if lang:
-        langs = [l.strip() for l in lang.split(",") if l.strip()]
+        langs = split_langs(lang)
     elif prompt:
         language_answer = typer.prompt(
             "Preferred subtitle language for deduplication (empty = majority)",
             default="",
             show_default=False,
         )
-        langs = [l.strip() for l in language_answer.split(",") if l.strip()]
+        langs = split_langs(language_answer)
     else:
         langs = None
 
@@ -362,7 +415,7 @@ def rebuild(
         for vtt_file in vtt_files:
             shutil.copy2(vtt_file, raw_dir / vtt_file.name)
 
-    with console.status("[bold green]Processing transcripts..."):
+    with spinner_status("[bold green]Processing transcripts..."):
         transcripts = process_vtt_directory(source, channel_name, preferred_langs=langs)
 
     if not transcripts:
@@ -375,14 +428,14 @@ def rebuild(
         per_volume=per_volume,
     )
 
-    with console.status("[bold green]Writing clean transcripts..."):
+    with spinner_status("[bold green]Writing clean transcripts..."):
         clean_files = create_clean_transcript_files(
             transcripts,
             clean_dir,
             source_marker_frequency=source_marker_frequency,
         )
 
-    with console.status("[bold green]Creating volumes..."):
+    with spinner_status("[bold green]Creating volumes..."):
         stats = create_volumes(
             transcripts=transcripts,
             output_dir=volumes_dir,
@@ -408,22 +461,47 @@ def status(
     """Show status of ytrag output."""
     directory = Path(directory).resolve()
 
-    # Find channel folders (folders with volumes)
+    # Find channel folders (folders with volumes). One scandir pass per
+    # project folder spots the volumes dir, the manifest and any legacy
+    # top-level volumes together, without the stat-per-entry of glob
     channels = []
-    for item in directory.iterdir():
-        if item.is_dir():
-            volumes_dir = item / "rag-volumes"
-            if volumes_dir.exists():
-                volumes = list(volumes_dir.glob("*_Vol*.txt"))
-            else:
-                volumes = list(item.glob("*_Vol*.txt"))
-            manifest = item / "manifest.json"
-            if volumes or manifest.exists():
-                channels.append({
-                    'name': item.name,
-                    'volumes': len(volumes),
-                    'has_manifest': manifest.exists(),
-                })
+    with os.scandir(directory) as entries:
+        project_dirs = [entry for entry in entries if entry.is_dir()]
+    for item in project_dirs:
+        volumes_entry = None
+        manifest_entry = None
+        volumes = 0
+        with os.scandir(item.path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == "rag-volumes" and entry.is_dir():
+                    volumes_entry = entry
+                elif name == "manifest.json":
+                    manifest_entry = entry
+                elif "_Vol" in name and name.endswith(".txt"):
+                    volumes += 1
+        if volumes_entry is not None:
+            # Fast path: a manifest at least as new as the volumes dir
+            # already knows the volume count, so skip the rescan
+            counted = None
+            if (manifest_entry is not None and
+                    manifest_entry.stat().st_mtime >= volumes_entry.stat().st_mtime):
+                try:
+                    with open(manifest_entry.path, 'rb') as f:
+                        counted = len(json.load(f).get('volumes') or [])
+                except (OSError, ValueError):
+                    counted = None
+            if counted is None:
+                with os.scandir(volumes_entry.path) as entries:
+                    counted = sum(1 for entry in entries
+                                  if "_Vol" in entry.name and entry.name.endswith(".txt"))
+            volumes = counted
+        if volumes or manifest_entry is not None:
+            channels.append({
+                'name': item.name,
+                'volumes': volumes,
+                'has_manifest': manifest_entry is not None,
+            })
 
     if not channels:
         console.print(Panel.fit(
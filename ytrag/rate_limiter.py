@@ -1,6 +1,7 @@
 # ytrag/rate_limiter.py
 """Adaptive rate limiter for YouTube API requests."""
 
+import random
 import time
 
 
@@ -28,6 +29,7 @@ class AdaptiveRateLimiter:
 
         self.current_sleep = base_sleep
         self.backoff_requests = 0
+        self._next_allowed = 0.0
 
     def on_rate_limit(self) -> None:
         """Call when YouTube returns 429. Doubles sleep time."""
@@ -49,5 +51,18 @@ class AdaptiveRateLimiter:
         return self.current_sleep
 
     def wait(self) -> None:
-        """Sleep for the current interval."""
-        time.sleep(self.current_sleep)
+        """Sleep until the next allowed request time.
+
+        Tracks a monotonic deadline instead of sleeping the full interval
+        unconditionally: time the caller spent on the request since the
+        previous wait() counts toward the interval, so slow requests do
+        not pay the sleep on top. A little jitter keeps request timing
+        from looking mechanical.
+        """
+        now = time.monotonic()
+        delay = self._next_allowed - now
+        if delay > 0:
+            time.sleep(delay)
+            now = time.monotonic()
+        jitter = random.uniform(0, 0.25 * self.current_sleep)
+        self._next_allowed = now + self.current_sleep + jitter
@@ -2,11 +2,22 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 # Archive file to track processed videos
 ARCHIVE_FILE = ".ytrag_archive"
 LANGUAGE_SUFFIX_RE = re.compile(r'\.([a-z]{2,3}(?:-[a-z0-9]{2,8})?)\.vtt$', re.IGNORECASE)
+# The language suffixes that actually occur on YouTube subtitle files;
+# extract_base_name slices these off without touching the regex
+_COMMON_LANG_SUFFIXES = ('.en.vtt', '.es.vtt', '.en-us.vtt', '.es-es.vtt', '.es-419.vtt')
+YOUTUBE_URL_RE = re.compile(
+    r'^https?://'
+    r'(www\.|m\.)?'
+    r'(youtube\.com|youtu\.be)'
+    r'/.*$',
+    re.IGNORECASE
+)
 
 
 def is_valid_youtube_url(url: str) -> bool:
@@ -17,14 +28,15 @@ def is_valid_youtube_url(url: str) -> bool:
     - youtube.com (with or without www/m prefix)
     - youtu.be (short URLs)
     """
-    youtube_pattern = re.compile(
-        r'^https?://'
-        r'(www\.|m\.)?'
-        r'(youtube\.com|youtu\.be)'
-        r'/.*$',
-        re.IGNORECASE
-    )
-    return bool(youtube_pattern.match(url))
+    # Cheap rejections first; the regex only runs on plausible URLs.
+    # Lowercase once so the gate stays as permissive as the
+    # case-insensitive regex it short-circuits.
+    low = url.lower()
+    if not low.startswith(('http://', 'https://')):
+        return False
+    if 'youtube.com' not in low and 'youtu.be' not in low:
+        return False
+    return bool(YOUTUBE_URL_RE.match(url))
 
 
 def ensure_dir(path: Path) -> Path:
@@ -33,28 +45,45 @@ def ensure_dir(path: Path) -> Path:
     return path
 
 
+# Problematic filename characters and their fullwidth replacements,
+# applied in one translate pass instead of a chain of str.replace calls
+_FILENAME_TABLE = str.maketrans({
+    '/': '⧸', '\\': '⧸',
+    ':': '：', '|': '｜',
+    '?': '？', '"': '＂',
+    '<': '＜', '>': '＞',
+    '*': '＊',
+})
+
+
 def sanitize_filename(name: str) -> str:
     """Remove or replace invalid filename characters."""
-    # Prevent path traversal
+    # Prevent path traversal (multi-char, so it stays a replace)
     name = name.replace('..', '_')
-    # Replace problematic characters
-    name = name.replace('/', '⧸').replace('\\', '⧸')
-    name = name.replace(':', '：').replace('|', '｜')
-    name = name.replace('?', '？').replace('"', '＂')
-    name = name.replace('<', '＜').replace('>', '＞')
-    name = name.replace('*', '＊')
-    return name.strip()
+    return name.translate(_FILENAME_TABLE).strip()
 
 
+@lru_cache(maxsize=8192)
 def extract_base_name(filepath: str) -> str:
     """
     Extract base name without language suffix and extension.
     '20251226_Video Title.en.vtt' -> '20251226_Video Title'
+
+    Memoized: the cleaner asks for the same filename several times per
+    file (sorting, deduplication, processing).
     """
     name = os.path.basename(filepath)
-    # Remove extension(s)
+    low = name.lower()
+    # Fast path: slice off the handful of suffixes YouTube actually
+    # emits; the regex only runs for unusual language tags
+    for suffix in _COMMON_LANG_SUFFIXES:
+        if low.endswith(suffix):
+            return name[:-len(suffix)]
+    # Remove extension(s); a plain suffix check beats spinning up the
+    # regex engine for a fixed 4-char extension
     name = LANGUAGE_SUFFIX_RE.sub('', name)
-    name = re.sub(r'\.vtt$', '', name, flags=re.IGNORECASE)
+    if name.lower().endswith('.vtt'):
+        name = name[:-4]
     return name
 
 
@@ -64,9 +93,15 @@ def is_regional_variant(filepath: str) -> bool:
     return '.en-us.' in name or '.es-es.' in name or '_en-us.' in name or '_es-es.' in name
 
 
+@lru_cache(maxsize=8192)
 def get_language_from_filename(filename: str) -> str:
-    """Extract language code from filename."""
-    match = LANGUAGE_SUFFIX_RE.search(os.path.basename(filename))
+    """Extract language code from filename. Memoized like extract_base_name."""
+    name = os.path.basename(filename)
+    # Suffix gate: anything that is not a .vtt cannot carry a language
+    # tag, so skip the regex for it
+    if not name.lower().endswith('.vtt'):
+        return 'ES'  # Default
+    match = LANGUAGE_SUFFIX_RE.search(name)
     if match:
         return match.group(1).upper()
     return 'ES'  # Default